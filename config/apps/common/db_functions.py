@@ -0,0 +1,58 @@
+"""
+Database functions shared across apps.
+"""
+import json
+
+from django.db import NotSupportedError
+from django.db.models import Func, JSONField, Value
+
+
+class JSONSet(Func):
+    """
+    Set a nested key inside a JSON column to ``value`` in the database.
+
+    ``path`` is a sequence of object keys; missing parent objects (and a
+    NULL column) are created, so a single UPDATE can patch one entry
+    without reading or rewriting the rest of the document:
+
+        MockExamAttempt.objects.filter(pk=pk).update(
+            answers=JSONSet('answers', ('math', question_id), 'B')
+        )
+
+    ``value`` may also be a scalar expression (e.g. ``F(...) + 1``), which is
+    evaluated by the database and stored as a JSON scalar.
+    """
+    output_field = JSONField()
+
+    def __init__(self, expression, path, value):
+        self.path = [str(key) for key in path]
+        self.value_is_json = not hasattr(value, 'resolve_expression')
+        if self.value_is_json:
+            value = Value(json.dumps(value))
+        super().__init__(expression, value)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError('JSONSet is only implemented for PostgreSQL and SQLite.')
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        target, target_params = compiler.compile(self.source_expressions[0])
+        value, value_params = compiler.compile(self.source_expressions[1])
+        if self.value_is_json:
+            value = f'JSON({value})'
+        # SQLite's json_set creates missing parent objects itself
+        json_path = '$' + ''.join('.' + json.dumps(key) for key in self.path)
+        sql = f"JSON_SET(COALESCE({target}, '{{}}'), %s, {value})"
+        return sql, (*target_params, json_path, *value_params)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        target, target_params = compiler.compile(self.source_expressions[0])
+        value, value_params = compiler.compile(self.source_expressions[1])
+        value = f'({value})::jsonb' if self.value_is_json else f'TO_JSONB({value})'
+        sql, params = f"COALESCE({target}, '{{}}'::jsonb)", [*target_params]
+        # jsonb_set only creates the last key, so seed each parent object first
+        for depth in range(1, len(self.path)):
+            parent = self.path[:depth]
+            sql = f"JSONB_SET({sql}, %s, COALESCE({target} #> %s, '{{}}'::jsonb), true)"
+            params += [parent, *target_params, parent]
+        sql = f"JSONB_SET({sql}, %s, {value}, true)"
+        return sql, (*params, self.path, *value_params)
@@ -343,17 +343,16 @@ class BluebookExamAttempt(TimestampedModel):
             # Default to easier if no answers
             difficulty = 'EASIER'
         else:
-            # Calculate accuracy
+            # Calculate accuracy, fetching every answer key in one query
             correct_count = 0
             total_count = len(answers)
+            correct_answers = dict(
+                Question.objects.filter(id__in=answers).values_list('id', 'correct_answer')
+            )
             
             for question_id, answer in answers.items():
-                try:
-                    question = Question.objects.get(id=question_id)
-                    if answer == question.correct_answer:
-                        correct_count += 1
-                except Question.DoesNotExist:
-                    continue
+                if answer == correct_answers.get(int(question_id)):
+                    correct_count += 1
             
             accuracy = (correct_count / total_count) * 100 if total_count > 0 else 0
             
@@ -407,22 +406,32 @@ class BluebookExamAttempt(TimestampedModel):
         reading_writing_correct = 0
         math_correct = 0
         
-        # Count correct answers by section
+        # Count correct answers by section; modules and answer keys are
+        # each fetched in a single query rather than one per answer
+        section_types = dict(
+            BluebookModule.objects.filter(id__in=self.module_answers)
+            .values_list('id', 'section__section_type')
+        )
+        correct_answers = dict(
+            Question.objects.filter(
+                id__in=[
+                    question_id
+                    for answers in self.module_answers.values()
+                    for question_id in answers
+                ]
+            ).values_list('id', 'correct_answer')
+        )
+        
         for module_id, answers in self.module_answers.items():
-            try:
-                module = BluebookModule.objects.get(id=module_id)
-                for question_id, answer in answers.items():
-                    try:
-                        question = Question.objects.get(id=question_id)
-                        if answer == question.correct_answer:
-                            if module.section_type == 'READING_WRITING':
-                                reading_writing_correct += 1
-                            elif module.section_type == 'MATH':
-                                math_correct += 1
-                    except Question.DoesNotExist:
-                        continue
-            except BluebookModule.DoesNotExist:
+            section_type = section_types.get(int(module_id))
+            if section_type is None:
                 continue
+            for question_id, answer in answers.items():
+                if answer == correct_answers.get(int(question_id)):
+                    if section_type == 'READING_WRITING':
+                        reading_writing_correct += 1
+                    elif section_type == 'MATH':
+                        math_correct += 1
         
         # Convert to SAT scores (simplified)
         # Reading & Writing: 200-800 scale
@@ -455,15 +464,14 @@ class BluebookExamAttempt(TimestampedModel):
         if not module_id:
             return 0
         
-        try:
-            module = BluebookModule.objects.get(id=module_id)
-            answers = self.module_answers.get(str(module_id), {})
-            total_questions = module.questions.count()
-            answered_questions = len(answers)
-            
-            return (answered_questions / total_questions * 100) if total_questions > 0 else 0
-        except BluebookModule.DoesNotExist:
-            return 0
+        # Count through the M2M table directly: one query, and an unknown
+        # module simply has no questions
+        total_questions = BluebookModule.questions.through.objects.filter(
+            bluebookmodule_id=module_id
+        ).count()
+        answered_questions = len(self.module_answers.get(str(module_id), {}))
+        
+        return (answered_questions / total_questions * 100) if total_questions > 0 else 0
     
     def get_current_progress(self):
         """Get progress for current module."""
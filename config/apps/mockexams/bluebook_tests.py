@@ -1,12 +1,30 @@
 """
 Comprehensive tests for Bluebook Digital SAT compliance.
 Tests the exact structure and rules of the official Digital SAT.
+
+The model test classes exercise exam structure, module progression,
+adaptive routing and scoring directly on the models. BluebookAPITests
+and BluebookComplianceTests go through the REST endpoints; their users
+are created without a password (Django stores an unusable one), so no
+password hashing runs and every request authenticates with
+force_authenticate.
+
+With PostgreSQL configured, pass --keepdb to reuse the test database
+between runs (see the README). For a quick run without a database
+server, use in-memory SQLite, which is rebuilt on every run:
+`TEST_SQLITE=True python manage.py test apps.mockexams.bluebook_tests`.
+
+The classes share no mutable module state and setUpTestData stores only
+picklable model instances, so `--parallel 4` can hand each class to its
+own worker process and cloned database.
 """
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.db.models import Count
 from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
+from collections import namedtuple
 from datetime import timedelta
 from decimal import Decimal
 
@@ -19,83 +37,70 @@ from apps.users.models import StudentProfile
 
 User = get_user_model()
 
+# Keyword arguments shared by the Digital SAT fixtures below
+EXAM_KW = dict(title='Digital SAT Practice Test', total_duration_minutes=134)
+RW_SECTION_KW = dict(section_type='READING_WRITING', section_order=1, total_duration_minutes=64)
+MATH_SECTION_KW = dict(section_type='MATH', section_order=2, total_duration_minutes=70)
+RW_MODULE_KW = dict(time_limit_minutes=32, difficulty_level='BASELINE')
+MATH_MODULE_KW = dict(time_limit_minutes=35, difficulty_level='BASELINE')
+
+DigitalSATStructure = namedtuple('DigitalSATStructure', [
+    'exam', 'rw_section', 'math_section',
+    'rw_module1', 'rw_module2', 'math_module1', 'math_module2',
+])
+
 
 class BluebookExamModelTests(TestCase):
     """Test cases for Bluebook Digital SAT exam models."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.teacher = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.teacher = User.objects.create_user(
             email='teacher@example.com',
-            password='testpass123',
             first_name='Teacher',
             last_name='User',
             role='MAIN_TEACHER'
         )
         
-        self.student = User.objects.create_user(
+        cls.student = User.objects.create_user(
             email='student@example.com',
-            password='testpass123',
             first_name='Student',
             last_name='User',
             role='STUDENT'
         )
 
         # Create Bluebook exam
-        self.exam = BluebookExam.objects.create(
-            title='Digital SAT Practice Test',
+        cls.exam = BluebookExam.objects.create(
             description='Official Digital SAT practice test',
-            total_duration_minutes=134
+            **EXAM_KW
         )
         
         # Create standard Digital SAT structure
-        self._create_digital_sat_structure()
+        cls._create_digital_sat_structure()
 
-    def _create_digital_sat_structure(self):
+    @classmethod
+    def _create_digital_sat_structure(cls):
         """Create the standard Digital SAT structure."""
-        # Reading & Writing Section
-        self.rw_section = BluebookSection.objects.create(
-            exam=self.exam,
-            section_type='READING_WRITING',
-            section_order=1,
-            total_duration_minutes=64
-        )
-        
-        self.rw_module1 = BluebookModule.objects.create(
-            section=self.rw_section,
-            module_order=1,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
-        
-        self.rw_module2 = BluebookModule.objects.create(
-            section=self.rw_section,
-            module_order=2,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
-        
-        # Math Section
-        self.math_section = BluebookSection.objects.create(
-            exam=self.exam,
-            section_type='MATH',
-            section_order=2,
-            total_duration_minutes=70
-        )
-        
-        self.math_module1 = BluebookModule.objects.create(
-            section=self.math_section,
-            module_order=1,
-            time_limit_minutes=35,
-            difficulty_level='BASELINE'
-        )
-        
-        self.math_module2 = BluebookModule.objects.create(
-            section=self.math_section,
-            module_order=2,
-            time_limit_minutes=35,
-            difficulty_level='BASELINE'
-        )
+        # Reading & Writing Section, then Math Section
+        cls.rw_section, cls.math_section = BluebookSection.objects.bulk_create([
+            BluebookSection(exam=cls.exam, **RW_SECTION_KW),
+            BluebookSection(exam=cls.exam, **MATH_SECTION_KW),
+        ])
+        
+        # Two modules per section, inserted in a single query
+        (
+            cls.rw_module1, cls.rw_module2,
+            cls.math_module1, cls.math_module2
+        ) = BluebookModule.objects.bulk_create([
+            BluebookModule(section=section, module_order=module_order, **module_kw)
+            for section, module_order, module_kw in [
+                (cls.rw_section, 1, RW_MODULE_KW),
+                (cls.rw_section, 2, RW_MODULE_KW),
+                (cls.math_section, 1, MATH_MODULE_KW),
+                (cls.math_section, 2, MATH_MODULE_KW),
+            ]
+        ])
 
     def test_bluebook_exam_creation(self):
         """Test Bluebook exam creation with validation."""
@@ -199,120 +204,92 @@ class BluebookExamModelTests(TestCase):
 class BluebookExamAttemptTests(TestCase):
     """Test cases for Bluebook Digital SAT exam attempts."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.student = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.student = User.objects.create_user(
             email='student@example.com',
-            password='testpass123',
             first_name='Student',
             last_name='User',
             role='STUDENT'
         )
 
         # Create exam structure
-        self.exam = BluebookExam.objects.create(
-            title='Digital SAT Practice Test',
-            total_duration_minutes=134
-        )
-        
-        self.rw_section = BluebookSection.objects.create(
-            exam=self.exam,
-            section_type='READING_WRITING',
-            section_order=1,
-            total_duration_minutes=64
-        )
-        
-        self.rw_module1 = BluebookModule.objects.create(
-            section=self.rw_section,
-            module_order=1,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
-        
-        self.rw_module2 = BluebookModule.objects.create(
-            section=self.rw_section,
-            module_order=2,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
-        
-        self.math_section = BluebookSection.objects.create(
-            exam=self.exam,
-            section_type='MATH',
-            section_order=2,
-            total_duration_minutes=70
-        )
-        
-        self.math_module1 = BluebookModule.objects.create(
-            section=self.math_section,
-            module_order=1,
-            time_limit_minutes=35,
-            difficulty_level='BASELINE'
-        )
-        
-        self.math_module2 = BluebookModule.objects.create(
-            section=self.math_section,
-            module_order=2,
-            time_limit_minutes=35,
-            difficulty_level='BASELINE'
-        )
+        cls.exam = BluebookExam.objects.create(**EXAM_KW)
+        
+        cls.rw_section, cls.math_section = BluebookSection.objects.bulk_create([
+            BluebookSection(exam=cls.exam, **RW_SECTION_KW),
+            BluebookSection(exam=cls.exam, **MATH_SECTION_KW),
+        ])
+        
+        (
+            cls.rw_module1, cls.rw_module2,
+            cls.math_module1, cls.math_module2
+        ) = BluebookModule.objects.bulk_create([
+            BluebookModule(section=cls.rw_section, module_order=1, **RW_MODULE_KW),
+            BluebookModule(section=cls.rw_section, module_order=2, **RW_MODULE_KW),
+            BluebookModule(section=cls.math_section, module_order=1, **MATH_MODULE_KW),
+            BluebookModule(section=cls.math_section, module_order=2, **MATH_MODULE_KW),
+        ])
 
         # Create test questions
-        self._create_test_questions()
+        cls._create_test_questions()
 
+    def setUp(self):
+        """Set up test data."""
         # Create attempt
         self.attempt = BluebookExamAttempt.objects.create(
             exam=self.exam,
             student=self.student
         )
 
-    def _create_test_questions(self):
-        """Create test questions for modules."""
-        # Create Reading & Writing questions
-        for i in range(27):  # 27 questions per module
-            question = Question.objects.create(
-                question_text=f'RW Question {i+1}',
-                question_type='READING',
-                options=['A', 'B', 'C', 'D'],
-                correct_answer='A',
-                difficulty='medium',
-                is_active=True
-            )
-            self.rw_module1.questions.add(question)
-        
-        for i in range(27):
-            question = Question.objects.create(
-                question_text=f'RW Question {i+28}',
-                question_type='WRITING',
-                options=['A', 'B', 'C', 'D'],
-                correct_answer='B',
-                difficulty='medium',
-                is_active=True
-            )
-            self.rw_module2.questions.add(question)
-        
-        # Create Math questions
-        for i in range(22):  # 22 questions per module
-            question = Question.objects.create(
-                question_text=f'Math Question {i+1}',
-                question_type='MATH',
-                options=['A', 'B', 'C', 'D'],
-                correct_answer='C',
-                difficulty='medium',
-                is_active=True
-            )
-            self.math_module1.questions.add(question)
-        
-        for i in range(22):
-            question = Question.objects.create(
-                question_text=f'Math Question {i+23}',
-                question_type='MATH',
-                options=['A', 'B', 'C', 'D'],
-                correct_answer='D',
-                difficulty='medium',
-                is_active=True
-            )
-            self.math_module2.questions.add(question)
+    @classmethod
+    def _create_test_questions(cls):
+        """
+        Create test questions for modules.
+
+        Rows are inserted with bulk_create, which skips Question.save() and
+        the pre_save/post_save signals on purpose: nothing in these tests
+        depends on those side effects. clean() is still called on each row
+        so the fixture stays valid the way save() would enforce.
+        """
+        module_specs = [
+            # (module, question_type, text prefix, first number, count, correct answer)
+            (cls.rw_module1, 'READING', 'RW Question', 1, 27, 'A'),
+            (cls.rw_module2, 'WRITING', 'RW Question', 28, 27, 'B'),
+            (cls.math_module1, 'MATH', 'Math Question', 1, 22, 'C'),
+            (cls.math_module2, 'MATH', 'Math Question', 23, 22, 'D'),
+        ]
+
+        questions_by_module = [
+            (module, [
+                Question(
+                    question_text=f'{prefix} {first + i}',
+                    question_type=question_type,
+                    options={'A': 'Option A', 'B': 'Option B', 'C': 'Option C', 'D': 'Option D'},
+                    correct_answer=correct_answer,
+                    difficulty=3,
+                    is_active=True
+                )
+                for i in range(count)
+            ])
+            for module, question_type, prefix, first, count, correct_answer in module_specs
+        ]
+
+        questions = [q for _, questions in questions_by_module for q in questions]
+        for question in questions:
+            question.clean()
+        Question.objects.bulk_create(questions, batch_size=500)
+
+        Through = BluebookModule.questions.through
+        Through.objects.bulk_create(
+            [
+                Through(bluebookmodule_id=module.id, question_id=question.id)
+                for module, questions in questions_by_module
+                for question in questions
+            ],
+            batch_size=500
+        )
 
     def test_attempt_creation(self):
         """Test attempt creation."""
@@ -324,7 +301,9 @@ class BluebookExamAttemptTests(TestCase):
 
     def test_start_exam(self):
         """Test starting the exam."""
-        self.attempt.start_exam()
+        # Pin the query count so N+1 regressions surface here
+        with self.assertNumQueries(3):
+            self.attempt.start_exam()
         
         self.assertIsNotNone(self.attempt.started_at)
         self.assertEqual(self.attempt.current_section, self.rw_section)
@@ -334,12 +313,14 @@ class BluebookExamAttemptTests(TestCase):
 
     def test_module_progression(self):
         """Test module progression rules."""
+        rw1_question_ids = list(self.rw_module1.questions.values_list('id', flat=True))
+
         # Start exam
         self.attempt.start_exam()
         
         # Submit Module 1 with high performance (should route to harder)
         module1_answers = {
-            str(q.id): 'A' for q in self.rw_module1.questions.all()[:20]  # 20 correct answers
+            str(qid): 'A' for qid in rw1_question_ids[:20]  # 20 correct answers
         }
         
         self.attempt.submit_module(module1_answers)
@@ -347,16 +328,18 @@ class BluebookExamAttemptTests(TestCase):
         # Check adaptive routing
         self.assertEqual(self.attempt.reading_writing_difficulty, 'HARDER')
         self.assertEqual(self.attempt.current_module, self.rw_module2)
-        self.assertIn(self.rw_module1, self.attempt.completed_modules.all())
+        self.assertTrue(self.attempt.completed_modules.filter(pk=self.rw_module1.pk).exists())
 
     def test_adaptive_difficulty_routing(self):
         """Test adaptive difficulty routing based on performance."""
+        rw1_question_ids = list(self.rw_module1.questions.values_list('id', flat=True))
+
         # Start exam
         self.attempt.start_exam()
         
         # Test high performance (70%+ accuracy)
         high_performance_answers = {
-            str(q.id): 'A' for q in self.rw_module1.questions.all()[:19]  # 19/27 = 70%
+            str(qid): 'A' for qid in rw1_question_ids[:19]  # 19/27 = 70%
         }
         
         self.attempt.submit_module(high_performance_answers)
@@ -367,9 +350,11 @@ class BluebookExamAttemptTests(TestCase):
         self.attempt.current_module = self.rw_module1
         self.attempt.completed_modules.clear()
         
-        # Test low performance (<40% accuracy)
+        # Test low performance (<40% accuracy): answer every question,
+        # but only the first 10 with the correct 'A'
         low_performance_answers = {
-            str(q.id): 'A' for q in self.rw_module1.questions.all()[:10]  # 10/27 = 37%
+            str(qid): 'A' if i < 10 else 'B'  # 10/27 = 37%
+            for i, qid in enumerate(rw1_question_ids)
         }
         
         self.attempt.submit_module(low_performance_answers)
@@ -403,18 +388,23 @@ class BluebookExamAttemptTests(TestCase):
 
     def test_module_submission(self):
         """Test module submission with time tracking."""
+        rw1_question_ids = list(self.rw_module1.questions.values_list('id', flat=True))
+
         # Start exam
         self.attempt.start_exam()
         
         # Submit module with answers
         answers = {
-            str(q.id): 'A' for q in self.rw_module1.questions.all()
+            str(qid): 'A' for qid in rw1_question_ids
         }
         
         original_start_time = self.attempt.current_module_start_time
         self.attempt.current_module_start_time = timezone.now() - timedelta(minutes=15)
         
-        self.attempt.submit_module(answers)
+        # Answer keys are fetched in one query, so the count does not
+        # grow with the number of answers submitted
+        with self.assertNumQueries(6):
+            self.attempt.submit_module(answers)
         
         # Check time tracking
         module_id = str(self.rw_module1.id)
@@ -425,20 +415,26 @@ class BluebookExamAttemptTests(TestCase):
 
     def test_exam_completion(self):
         """Test complete exam flow."""
+        # Fetch each module's questions once, before the attempt starts
+        module_question_ids = [
+            list(module.questions.values_list('id', flat=True))
+            for module in (
+                self.rw_module1, self.rw_module2,
+                self.math_module1, self.math_module2
+            )
+        ]
+
         # Start exam
         self.attempt.start_exam()
         
-        # Complete all modules
-        modules = [
-            self.rw_module1, self.rw_module2,
-            self.math_module1, self.math_module2
-        ]
-        
-        for module in modules:
-            answers = {
-                str(q.id): 'A' for q in module.questions.all()
-            }
-            self.attempt.submit_module(answers)
+        # Complete all modules; scoring fetches modules and answer keys in
+        # one query each, so 98 answers cost the same as one
+        with self.assertNumQueries(25):
+            for question_ids in module_question_ids:
+                answers = {
+                    str(qid): 'A' for qid in question_ids
+                }
+                self.attempt.submit_module(answers)
         
         # Check exam completion
         self.assertTrue(self.attempt.is_completed)
@@ -454,20 +450,23 @@ class BluebookExamAttemptTests(TestCase):
         
         # Submit Module 1 with high performance (routes to harder)
         high_performance_answers = {
-            str(q.id): 'A' for q in self.rw_module1.questions.all()[:20]
+            str(qid): answer
+            for qid, answer in self.rw_module1.questions.values_list('id', 'correct_answer')[:20]
         }
         self.attempt.submit_module(high_performance_answers)
         
         # Submit Module 2 (harder) with same performance
         harder_answers = {
-            str(q.id): 'A' for q in self.rw_module2.questions.all()[:20]
+            str(qid): answer
+            for qid, answer in self.rw_module2.questions.values_list('id', 'correct_answer')[:20]
         }
         self.attempt.submit_module(harder_answers)
         
         # Complete math modules
         for module in [self.math_module1, self.math_module2]:
             answers = {
-                str(q.id): 'A' for q in module.questions.all()[:15]
+                str(qid): answer
+                for qid, answer in module.questions.values_list('id', 'correct_answer')[:15]
             }
             self.attempt.submit_module(answers)
         
@@ -497,12 +496,16 @@ class BluebookExamAttemptTests(TestCase):
         self.attempt.start_exam()
         
         # Answer some questions
-        questions = list(self.rw_module1.questions.all()[:5])
-        answers = {str(q.id): 'A' for q in questions}
+        question_ids = self.rw_module1.questions.values_list('id', flat=True)[:5]
+        answers = {str(qid): 'A' for qid in question_ids}
+        self.attempt.module_answers[str(self.rw_module1.id)] = answers
         
         # Check progress
         progress = self.attempt.get_module_progress(self.rw_module1.id)
-        expected_progress = (5 / self.rw_module1.questions.count()) * 100
+        question_count = BluebookModule.objects.annotate(
+            question_count=Count('questions')
+        ).get(pk=self.rw_module1.pk).question_count
+        expected_progress = (5 / question_count) * 100
         self.assertAlmostEqual(progress, expected_progress, places=1)
 
     def test_exam_constraints_validation(self):
@@ -525,76 +528,69 @@ class BluebookExamAttemptTests(TestCase):
 class BluebookAPITests(APITestCase):
     """Test cases for Bluebook Digital SAT API endpoints."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.teacher = User.objects.create_user(
+    EXAMS_URL = '/api/bluebook/exams/'
+    ATTEMPTS_URL = '/api/bluebook/attempts/'
+    EXAM_STATISTICS_URL = '/api/bluebook/management/exam_statistics/'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.teacher = User.objects.create_user(
             email='teacher@example.com',
-            password='testpass123',
             first_name='Teacher',
             last_name='User',
             role='MAIN_TEACHER'
         )
         
-        self.student = User.objects.create_user(
+        cls.student = User.objects.create_user(
             email='student@example.com',
-            password='testpass123',
             first_name='Student',
             last_name='User',
             role='STUDENT'
         )
 
         # Create exam
-        self.exam = BluebookExam.objects.create(
-            title='Digital SAT Practice Test',
-            total_duration_minutes=134
-        )
+        cls.exam = BluebookExam.objects.create(**EXAM_KW)
         
         # Create structure
-        self._create_digital_sat_structure()
+        cls._create_digital_sat_structure()
+
+        # Shared submission timestamp for completed-attempt fixtures
+        cls.now = timezone.now()
+
+    def setUp(self):
+        """Set up test data."""
+        self.start_attempt_url = self._exam_url(self.exam, 'start_attempt')
+
+        # Most endpoints are exercised as the student; teacher tests
+        # re-authenticate explicitly
+        self.client.force_authenticate(user=self.student)
+
+    def _exam_url(self, exam, action):
+        """Build the URL of an exam detail action."""
+        return f'{self.EXAMS_URL}{exam.id}/{action}/'
 
-    def _create_digital_sat_structure(self):
+    def _attempt_url(self, attempt, action):
+        """Build the URL of an attempt detail action."""
+        return f'{self.ATTEMPTS_URL}{attempt.id}/{action}/'
+
+    @classmethod
+    def _create_digital_sat_structure(cls):
         """Create Digital SAT structure."""
-        rw_section = BluebookSection.objects.create(
-            exam=self.exam,
-            section_type='READING_WRITING',
-            section_order=1,
-            total_duration_minutes=64
-        )
-        
-        BluebookModule.objects.create(
-            section=rw_section,
-            module_order=1,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
-        
-        BluebookModule.objects.create(
-            section=rw_section,
-            module_order=2,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
-        
-        math_section = BluebookSection.objects.create(
-            exam=self.exam,
-            section_type='MATH',
-            section_order=2,
-            total_duration_minutes=70
-        )
-        
-        BluebookModule.objects.create(
-            section=math_section,
-            module_order=1,
-            time_limit_minutes=35,
-            difficulty_level='BASELINE'
-        )
-        
-        BluebookModule.objects.create(
-            section=math_section,
-            module_order=2,
-            time_limit_minutes=35,
-            difficulty_level='BASELINE'
-        )
+        rw_section, math_section = BluebookSection.objects.bulk_create([
+            BluebookSection(exam=cls.exam, **RW_SECTION_KW),
+            BluebookSection(exam=cls.exam, **MATH_SECTION_KW),
+        ])
+        
+        BluebookModule.objects.bulk_create([
+            BluebookModule(section=section, module_order=module_order, **module_kw)
+            for section, module_order, module_kw in [
+                (rw_section, 1, RW_MODULE_KW),
+                (rw_section, 2, RW_MODULE_KW),
+                (math_section, 1, MATH_MODULE_KW),
+                (math_section, 2, MATH_MODULE_KW),
+            ]
+        ])
 
     def test_create_bluebook_exam(self):
         """Test creating a Bluebook exam."""
@@ -606,7 +602,7 @@ class BluebookAPITests(APITestCase):
             'is_active': True
         }
         
-        response = self.client.post('/api/bluebook/exams/', data)
+        response = self.client.post(self.EXAMS_URL, data)
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['title'], 'New Digital SAT Test')
@@ -619,21 +615,17 @@ class BluebookAPITests(APITestCase):
 
     def test_create_exam_student_forbidden(self):
         """Test that students cannot create exams."""
-        self.client.force_authenticate(user=self.student)
-        
         data = {
             'title': 'Student Created Exam',
             'description': 'Should not be allowed'
         }
         
-        response = self.client.post('/api/bluebook/exams/', data)
+        response = self.client.post(self.EXAMS_URL, data)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_start_exam_attempt(self):
         """Test starting an exam attempt."""
-        self.client.force_authenticate(user=self.student)
-        
-        response = self.client.post(f'/api/bluebook/exams/{self.exam.id}/start_attempt/')
+        response = self.client.post(self.start_attempt_url)
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['exam']['id'], self.exam.id)
@@ -641,14 +633,12 @@ class BluebookAPITests(APITestCase):
 
     def test_start_attempt_duplicate_prevention(self):
         """Test that duplicate attempts are prevented."""
-        self.client.force_authenticate(user=self.student)
-        
         # Create first attempt
-        response1 = self.client.post(f'/api/bluebook/exams/{self.exam.id}/start_attempt/')
+        response1 = self.client.post(self.start_attempt_url)
         self.assertEqual(response1.status_code, status.HTTP_201_CREATED)
         
         # Try to create second attempt
-        response2 = self.client.post(f'/api/bluebook/exams/{self.exam.id}/start_attempt/')
+        response2 = self.client.post(self.start_attempt_url)
         self.assertEqual(response2.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_start_exam_session(self):
@@ -659,9 +649,7 @@ class BluebookAPITests(APITestCase):
             student=self.student
         )
         
-        self.client.force_authenticate(user=self.student)
-        
-        response = self.client.post(f'/api/bluebook/attempts/{attempt.id}/start_exam/')
+        response = self.client.post(self._attempt_url(attempt, 'start_exam'))
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIsNotNone(response.data['started_at'])
@@ -677,9 +665,7 @@ class BluebookAPITests(APITestCase):
         )
         attempt.start_exam()
         
-        self.client.force_authenticate(user=self.student)
-        
-        response = self.client.get(f'/api/bluebook/attempts/{attempt.id}/status/')
+        response = self.client.get(self._attempt_url(attempt, 'status'))
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['exam']['id'], self.exam.id)
@@ -695,9 +681,7 @@ class BluebookAPITests(APITestCase):
         )
         attempt.start_exam()
         
-        self.client.force_authenticate(user=self.student)
-        
-        response = self.client.get(f'/api/bluebook/attempts/{attempt.id}/current_module/')
+        response = self.client.get(self._attempt_url(attempt, 'current_module'))
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['module_order'], 1)
@@ -712,8 +696,7 @@ class BluebookAPITests(APITestCase):
             student=self.student
         )
         attempt.start_exam()
-        
-        self.client.force_authenticate(user=self.student)
+        module_id = str(attempt.current_module_id)
         
         # Submit module answers
         data = {
@@ -721,11 +704,15 @@ class BluebookAPITests(APITestCase):
             'flagged_questions': [1]
         }
         
-        response = self.client.post(f'/api/bluebook/attempts/{attempt.id}/submit_module/', data)
+        response = self.client.post(
+            self._attempt_url(attempt, 'submit_module'), data, format='json'
+        )
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('1', response.data.get('module_answers', {}))
-        self.assertIn('2', response.data.get('module_answers', {}))
+        
+        # The status response omits module_answers, so check the stored attempt
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.module_answers[module_id], {'1': 'A', '2': 'B'})
 
     def test_flag_question(self):
         """Test flagging a question."""
@@ -736,22 +723,22 @@ class BluebookAPITests(APITestCase):
         )
         attempt.start_exam()
         
-        self.client.force_authenticate(user=self.student)
+        flag_url = self._attempt_url(attempt, 'flag_question')
         
         # Flag question
-        response = self.client.post(f'/api/bluebook/attempts/{attempt.id}/flag_question/', {
+        response = self.client.post(flag_url, {
             'question_id': 1,
             'flagged': True
-        })
+        }, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(response.data['flagged'])
         
         # Unflag question
-        response = self.client.post(f'/api/bluebook/attempts/{attempt.id}/flag_question/', {
+        response = self.client.post(flag_url, {
             'question_id': 1,
             'flagged': False
-        })
+        }, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertFalse(response.data['flagged'])
@@ -763,15 +750,13 @@ class BluebookAPITests(APITestCase):
             exam=self.exam,
             student=self.student,
             is_completed=True,
-            submitted_at=timezone.now(),
+            submitted_at=self.now,
             total_score=1200,
             reading_writing_score=600,
             math_score=600
         )
         
-        self.client.force_authenticate(user=self.student)
-        
-        response = self.client.get(f'/api/bluebook/attempts/{attempt.id}/results/')
+        response = self.client.get(self._attempt_url(attempt, 'results'))
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['total_score'], 1200)
@@ -780,9 +765,7 @@ class BluebookAPITests(APITestCase):
 
     def test_exam_structure_endpoint(self):
         """Test getting exam structure."""
-        self.client.force_authenticate(user=self.student)
-        
-        response = self.client.get(f'/api/bluebook/exams/{self.exam.id}/structure/')
+        response = self.client.get(self._exam_url(self.exam, 'structure'))
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['sections']), 2)
@@ -801,253 +784,134 @@ class BluebookAPITests(APITestCase):
         """Test exam statistics endpoint (admin only)."""
         self.client.force_authenticate(user=self.teacher)
         
-        # Create some attempts
-        BluebookExamAttempt.objects.create(
-            exam=self.exam,
-            student=self.student,
-            is_completed=True,
-            total_score=1200
-        )
+        # Create one completed attempt per student, bulk-inserted
+        students = [self.student] + User.objects.bulk_create([
+            User(email=f'student{i}@example.com', role='STUDENT')
+            for i in range(1, 4)
+        ])
+        BluebookExamAttempt.objects.bulk_create([
+            BluebookExamAttempt(
+                exam=self.exam,
+                student=student,
+                is_completed=True,
+                total_score=1000 + 100 * i
+            )
+            for i, student in enumerate(students)
+        ])
         
-        response = self.client.get('/api/bluebook/management/exam_statistics/')
+        response = self.client.get(self.EXAM_STATISTICS_URL)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('total_exams', response.data)
         self.assertIn('total_attempts', response.data)
         self.assertIn('completed_attempts', response.data)
         self.assertIn('average_score', response.data)
+        self.assertEqual(response.data['total_attempts'], 4)
+        self.assertEqual(response.data['completed_attempts'], 4)
+        self.assertEqual(response.data['average_score'], 1150)
 
 
 class BluebookComplianceTests(TestCase):
     """Test cases for strict Digital SAT compliance."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.student = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.student = User.objects.create_user(
             email='student@example.com',
-            password='testpass123',
             role='STUDENT'
         )
 
-    def test_digital_sat_duration_compliance(self):
-        """Test that exams comply with Digital SAT duration requirements."""
-        exam = BluebookExam.objects.create(
-            title='Digital SAT Test',
-            total_duration_minutes=134
-        )
-        
-        # Create structure
-        rw_section = BluebookSection.objects.create(
-            exam=exam,
-            section_type='READING_WRITING',
-            section_order=1,
-            total_duration_minutes=64
-        )
+        cls.exam = BluebookExam.objects.create(**EXAM_KW)
         
-        math_section = BluebookSection.objects.create(
-            exam=exam,
-            section_type='MATH',
-            section_order=2,
-            total_duration_minutes=70
+        cls.rw_section, cls.math_section = BluebookSection.objects.bulk_create([
+            BluebookSection(exam=cls.exam, **RW_SECTION_KW),
+            BluebookSection(exam=cls.exam, **MATH_SECTION_KW),
+        ])
+
+        # Shared submission timestamp for completed-attempt fixtures
+        cls.now = timezone.now()
+
+    def _make_full_structure(self):
+        """Add both modules of each shared section and return the whole tree."""
+        rw_module1, rw_module2, math_module1, math_module2 = BluebookModule.objects.bulk_create([
+            BluebookModule(section=self.rw_section, module_order=1, **RW_MODULE_KW),
+            BluebookModule(section=self.rw_section, module_order=2, **RW_MODULE_KW),
+            BluebookModule(section=self.math_section, module_order=1, **MATH_MODULE_KW),
+            BluebookModule(section=self.math_section, module_order=2, **MATH_MODULE_KW),
+        ])
+        return DigitalSATStructure(
+            self.exam, self.rw_section, self.math_section,
+            rw_module1, rw_module2, math_module1, math_module2
         )
-        
+
+    def test_digital_sat_duration_compliance(self):
+        """Test that exams comply with Digital SAT duration requirements."""
         # Verify total duration
-        total_time = rw_section.total_duration_minutes + math_section.total_duration_minutes
+        total_time = self.rw_section.total_duration_minutes + self.math_section.total_duration_minutes
         self.assertEqual(total_time, 134)  # 2 hours 14 minutes
 
     def test_module_timing_compliance(self):
         """Test that modules comply with Digital SAT timing requirements."""
-        exam = BluebookExam.objects.create(
-            title='Digital SAT Test',
-            total_duration_minutes=134
-        )
+        structure = self._make_full_structure()
         
         # Reading & Writing modules must be 32 minutes each
-        rw_section = BluebookSection.objects.create(
-            exam=exam,
-            section_type='READING_WRITING',
-            section_order=1,
-            total_duration_minutes=64
-        )
-        
-        rw_module1 = BluebookModule.objects.create(
-            section=rw_section,
-            module_order=1,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
-        
-        rw_module2 = BluebookModule.objects.create(
-            section=rw_section,
-            module_order=2,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
-        
+        self.assertEqual(structure.rw_module1.time_limit_minutes, 32)
+        self.assertEqual(structure.rw_module2.time_limit_minutes, 32)
         # Math modules must be 35 minutes each
-        math_section = BluebookSection.objects.create(
-            exam=exam,
-            section_type='MATH',
-            section_order=2,
-            total_duration_minutes=70
-        )
-        
-        math_module1 = BluebookModule.objects.create(
-            section=math_section,
-            module_order=1,
-            time_limit_minutes=35,
-            difficulty_level='BASELINE'
-        )
-        
-        math_module2 = BluebookModule.objects.create(
-            section=math_section,
-            module_order=2,
-            time_limit_minutes=35,
-            difficulty_level='BASELINE'
-        )
-        
-        # Verify timing
-        self.assertEqual(rw_module1.time_limit_minutes, 32)
-        self.assertEqual(rw_module2.time_limit_minutes, 32)
-        self.assertEqual(math_module1.time_limit_minutes, 35)
-        self.assertEqual(math_module2.time_limit_minutes, 35)
+        self.assertEqual(structure.math_module1.time_limit_minutes, 35)
+        self.assertEqual(structure.math_module2.time_limit_minutes, 35)
 
     def test_adaptive_structure_compliance(self):
         """Test that adaptive structure complies with Digital SAT rules."""
-        exam = BluebookExam.objects.create(
-            title='Digital SAT Test',
-            total_duration_minutes=134
-        )
-        
-        # Create sections
-        rw_section = BluebookSection.objects.create(
-            exam=exam,
-            section_type='READING_WRITING',
-            section_order=1,
-            total_duration_minutes=64
-        )
-        
-        math_section = BluebookSection.objects.create(
-            exam=exam,
-            section_type='MATH',
-            section_order=2,
-            total_duration_minutes=70
-        )
+        structure = self._make_full_structure()
         
         # Module 1 must be baseline
-        rw_module1 = BluebookModule.objects.create(
-            section=rw_section,
-            module_order=1,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
-        
-        math_module1 = BluebookModule.objects.create(
-            section=math_section,
-            module_order=1,
-            time_limit_minutes=35,
-            difficulty_level='BASELINE'
-        )
-        
+        self.assertFalse(structure.rw_module1.is_adaptive)
+        self.assertFalse(structure.math_module1.is_adaptive)
         # Module 2 must be adaptive (initially baseline, will be set adaptively)
-        rw_module2 = BluebookModule.objects.create(
-            section=rw_section,
-            module_order=2,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
-        
-        math_module2 = BluebookModule.objects.create(
-            section=math_section,
-            module_order=2,
-            time_limit_minutes=35,
-            difficulty_level='BASELINE'
-        )
-        
-        # Verify adaptive properties
-        self.assertFalse(rw_module1.is_adaptive)
-        self.assertFalse(math_module1.is_adaptive)
-        self.assertTrue(rw_module2.is_adaptive)
-        self.assertTrue(math_module2.is_adaptive)
+        self.assertTrue(structure.rw_module2.is_adaptive)
+        self.assertTrue(structure.math_module2.is_adaptive)
 
     def test_scoring_range_compliance(self):
         """Test that scoring complies with Digital SAT range requirements."""
-        exam = BluebookExam.objects.create(
-            title='Digital SAT Test',
-            total_duration_minutes=134
-        )
-        
-        # Create structure
-        rw_section = BluebookSection.objects.create(
-            exam=exam,
-            section_type='READING_WRITING',
-            section_order=1,
-            total_duration_minutes=64
-        )
-        
-        math_section = BluebookSection.objects.create(
-            exam=exam,
-            section_type='MATH',
-            section_order=2,
-            total_duration_minutes=70
-        )
+        # Create completed attempt; only the stored row shape matters here,
+        # so bulk_create skips save() and its signals
+        attempt, = BluebookExamAttempt.objects.bulk_create([
+            BluebookExamAttempt(
+                exam=self.exam,
+                student=self.student,
+                is_completed=True,
+                submitted_at=self.now,
+                reading_writing_score=600,
+                math_score=600,
+                total_score=1200
+            )
+        ])
         
-        # Create completed attempt
-        attempt = BluebookExamAttempt.objects.create(
-            exam=exam,
-            student=self.student,
-            is_completed=True,
-            submitted_at=timezone.now(),
-            reading_writing_score=600,
-            math_score=600,
-            total_score=1200
+        # Verify scoring ranges: clamping to the Digital SAT bounds must be
+        # a no-op, and a failure shows which score fell outside its range
+        scores = (attempt.reading_writing_score, attempt.math_score, attempt.total_score)
+        bounds = ((200, 800), (200, 800), (400, 1600))
+        self.assertEqual(
+            tuple(min(max(score, low), high) for score, (low, high) in zip(scores, bounds)),
+            scores
         )
-        
-        # Verify scoring ranges
-        self.assertGreaterEqual(attempt.reading_writing_score, 200)
-        self.assertLessEqual(attempt.reading_writing_score, 800)
-        self.assertGreaterEqual(attempt.math_score, 200)
-        self.assertLessEqual(attempt.math_score, 800)
-        self.assertGreaterEqual(attempt.total_score, 400)
-        self.assertLessEqual(attempt.total_score, 1600)
 
     def test_navigation_restrictions(self):
         """Test that navigation restrictions comply with Digital SAT rules."""
-        exam = BluebookExam.objects.create(
-            title='Digital SAT Test',
-            total_duration_minutes=134
-        )
-        
-        # Create structure
-        rw_section = BluebookSection.objects.create(
-            exam=exam,
-            section_type='READING_WRITING',
-            section_order=1,
-            total_duration_minutes=64
-        )
-        
-        rw_module1 = BluebookModule.objects.create(
-            section=rw_section,
-            module_order=1,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
-        
-        rw_module2 = BluebookModule.objects.create(
-            section=rw_section,
-            module_order=2,
-            time_limit_minutes=32,
-            difficulty_level='BASELINE'
-        )
+        structure = self._make_full_structure()
+        rw_module1, rw_module2 = structure.rw_module1, structure.rw_module2
         
         # Create attempt
         attempt = BluebookExamAttempt.objects.create(
-            exam=exam,
+            exam=self.exam,
             student=self.student
         )
         
-        # Start exam
-        attempt.start_exam()
+        # Start exam; query counts are pinned to catch N+1 regressions
+        with self.assertNumQueries(3):
+            attempt.start_exam()
         
         # Verify current module is Module 1
         self.assertEqual(attempt.current_module, rw_module1)
@@ -1057,11 +921,12 @@ class BluebookComplianceTests(TestCase):
         
         # Submit Module 1
         answers = {'1': 'A'}
-        attempt.submit_module(answers)
+        with self.assertNumQueries(6):
+            attempt.submit_module(answers)
         
         # Now should be in Module 2
         self.assertEqual(attempt.current_module, rw_module2)
         
         # Cannot go back to Module 1
         self.assertNotEqual(attempt.current_module, rw_module1)
-        self.assertIn(rw_module1, attempt.completed_modules.all())
+        self.assertQuerySetEqual(attempt.completed_modules.all(), [rw_module1], ordered=False)
@@ -5,10 +5,16 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter
-from django.db.models import Q, Count, Avg, StdDev, Max, Min
+from django.db.models import (
+    Q, F, Count, Avg, StdDev, Max, Min, Value, CharField, DurationField,
+    IntegerField, ExpressionWrapper
+)
+from django.db.models.fields.json import KeyTextTransform
+from django.core.cache import cache
 from django.utils import timezone
-from django.db.models.functions import TruncDate, TruncWeek, TruncMonth
+from django.db.models.functions import Cast, Coalesce, TruncDate, TruncWeek, TruncMonth
 from datetime import timedelta, datetime
+from collections import Counter
 import json
 
 from apps.mockexams.models import MockExam, MockExamAttempt
@@ -16,8 +22,115 @@ from apps.mockexams.serializers import (
     MockExamStatsSerializer,
     StudentMockExamProgressSerializer
 )
+from apps.common.db_functions import JSONSet
 from apps.common.permissions import IsStudent, IsTeacherOrAdmin
 
+# Peer aggregates scan every completed attempt and drift slowly
+PEER_STATS_CACHE_TIMEOUT = 300
+SCORE_PREDICTION_CACHE_TIMEOUT = 3600
+# Exam question sets rarely change while students are sitting them
+QUESTION_SECTION_CACHE_TIMEOUT = 300
+
+SECTIONS = ('math', 'reading', 'writing')
+
+# Sections counted towards an exam's total, mirroring MockExam.total_questions
+EXAM_TYPE_SECTIONS = {
+    'FULL': SECTIONS,
+    'MATH_ONLY': ('math',),
+    'READING_WRITING_ONLY': ('reading', 'writing'),
+}
+
+# Static study-plan tables; shared across requests, so treat them as read-only
+SECTION_RECOMMENDATIONS = {
+    'math_basic': (
+        'Focus on fundamental algebra concepts',
+        'Practice basic arithmetic operations',
+        'Review geometry formulas and theorems'
+    ),
+    'math_advanced': (
+        'Work on advanced problem-solving strategies',
+        'Practice time management for complex problems',
+        'Review data analysis and statistics'
+    ),
+    'reading': (
+        'Practice active reading techniques',
+        'Focus on vocabulary building',
+        'Work on passage analysis strategies'
+    ),
+    'writing': (
+        'Review grammar rules and conventions',
+        'Practice essay structure and organization',
+        'Work on sentence clarity and conciseness'
+    ),
+}
+
+WEEKLY_GOALS_BEGINNER = (
+    'Complete 2 practice sections',
+    'Review 50 vocabulary words',
+    'Practice 30 math problems',
+    'Read 3 passages daily'
+)
+WEEKLY_GOALS_INTERMEDIATE = (
+    'Complete 1 full practice test',
+    'Focus on weak areas',
+    'Practice timed sections',
+    'Review mistakes thoroughly'
+)
+WEEKLY_GOALS_ADVANCED = (
+    'Complete 2 full practice tests',
+    'Focus on timing strategies',
+    'Practice advanced problems',
+    'Perfect calculator usage'
+)
+
+DAILY_TASKS_BEGINNER = (
+    '30 minutes math practice',
+    '20 minutes vocabulary',
+    '15 minutes reading practice'
+)
+DAILY_TASKS_INTERMEDIATE = (
+    '45 minutes focused practice',
+    '15 minutes review mistakes',
+    '10 minutes vocabulary'
+)
+DAILY_TASKS_ADVANCED = (
+    '60 minutes advanced practice',
+    '30 minutes timed sections',
+    '15 minutes strategy review'
+)
+
+MILESTONES_BEGINNER = (
+    {'score': 1000, 'description': 'Reach Intermediate Level', 'timeline': '2-3 months'},
+    {'score': 1100, 'description': 'Build Consistency', 'timeline': '4-5 months'}
+)
+MILESTONES_INTERMEDIATE = (
+    {'score': 1200, 'description': 'Reach Advanced Level', 'timeline': '2-3 months'},
+    {'score': 1300, 'description': 'Strong Performance', 'timeline': '4-6 months'}
+)
+MILESTONES_ADVANCED = (
+    {'score': 1400, 'description': 'Expert Level', 'timeline': '3-4 months'},
+    {'score': 1500, 'description': 'Top Performer', 'timeline': '5-6 months'}
+)
+MILESTONES_EXPERT = (
+    {'score': 1550, 'description': 'Near Perfect', 'timeline': '2-3 months'},
+    {'score': 1600, 'description': 'Perfect Score', 'timeline': '4-6 months'}
+)
+
+
+def _fit_trend(scores):
+    """Least-squares line through scores at x = 0..n-1; returns (slope, intercept)."""
+    n = len(scores)
+    
+    # Calculate slope (trend); x is 0..n-1, so its sums have closed forms
+    sum_x = n * (n - 1) // 2
+    sum_x2 = (n - 1) * n * (2 * n - 1) // 6
+    sum_y = sum(scores)
+    sum_xy = sum(i * score for i, score in enumerate(scores))
+    
+    slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x ** 2)
+    intercept = (sum_y - slope * sum_x) / n
+    return slope, intercept
+
 
 class ExamAnalyticsViewSet(viewsets.ViewSet):
     """
@@ -25,6 +138,11 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
     """
     permission_classes = [IsStudent]
 
+    # Attempt columns read by _analyze_all_sections
+    SECTION_SCORE_FIELDS = (
+        'mock_exam_id', 'math_raw_score', 'reading_raw_score', 'writing_raw_score'
+    )
+
     @extend_schema(
         summary="Get performance trends",
         description="Get student's performance trends over time with various metrics.",
@@ -74,21 +192,35 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
         if exam_type:
             queryset = queryset.filter(mock_exam__exam_type=exam_type)
 
-        attempts = queryset.order_by('started_at')
+        # Project only the columns read below; no model instances are built
+        rows = queryset.order_by('started_at').annotate(
+            date=TruncDate('started_at')
+        ).values_list(
+            'date', 'started_at', 'submitted_at', 'total_raw_score', 'sat_score',
+            'math_scaled_score', 'reading_scaled_score', 'writing_scaled_score',
+            'mock_exam_id', 'mock_exam__exam_type',
+            named=True
+        )
+        question_totals = self._exam_question_totals(
+            {row.mock_exam_id: row.mock_exam__exam_type for row in rows}
+        )
 
         # Calculate trends
-        trend_data = []
-        for attempt in attempts:
-            trend_data.append({
-                'date': attempt.started_at.strftime('%Y-%m-%d'),
-                'total_score': attempt.sat_score or 0,
-                'math_score': attempt.math_scaled_score or 0,
-                'reading_score': attempt.reading_scaled_score or 0,
-                'writing_score': attempt.writing_scaled_score or 0,
-                'exam_type': attempt.mock_exam.exam_type,
-                'time_spent': int(attempt.duration_seconds),
-                'accuracy': self._calculate_accuracy(attempt)
-            })
+        trend_data = [
+            {
+                'date': row.date.isoformat(),
+                'total_score': row.sat_score or 0,
+                'math_score': row.math_scaled_score or 0,
+                'reading_score': row.reading_scaled_score or 0,
+                'writing_score': row.writing_scaled_score or 0,
+                'exam_type': row.mock_exam__exam_type,
+                'time_spent': int(((row.submitted_at or now) - row.started_at).total_seconds()),
+                'accuracy': self._calculate_accuracy(
+                    row.total_raw_score, question_totals[row.mock_exam_id]
+                )
+            }
+            for row in rows
+        ]
 
         return Response({
             'trends': trend_data,
@@ -105,17 +237,18 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
         """Get weak areas analysis for the current student."""
         user = request.user
 
-        # Get completed attempts
+        # Get completed attempts as plain rows
         attempts = MockExamAttempt.objects.filter(
             student=user,
             is_completed=True
-        ).order_by('-started_at')[:10]  # Last 10 attempts
+        ).order_by('-started_at').values(*self.SECTION_SCORE_FIELDS)[:10]  # Last 10 attempts
 
         weak_areas = []
         
         # Analyze by section
-        for section in ['math', 'reading', 'writing']:
-            section_performance = self._analyze_section_performance(attempts, section)
+        performance_by_section = self._analyze_all_sections(attempts)
+        for section in SECTIONS:
+            section_performance = performance_by_section[section]
             if section_performance['accuracy'] < 70:  # Less than 70% accuracy
                 weak_areas.append({
                     'section': section,
@@ -154,18 +287,16 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
         exam_id = request.query_params.get('exam_id')
 
         if exam_id:
-            # Analysis for specific exam
-            try:
-                exam = MockExam.objects.get(id=exam_id)
-                attempts = MockExamAttempt.objects.filter(
-                    mock_exam=exam,
-                    is_completed=True
-                )
-            except MockExam.DoesNotExist:
+            # Analysis for specific exam; only its existence is needed
+            if not MockExam.objects.filter(id=exam_id).exists():
                 return Response(
                     {"detail": "Exam not found"},
                     status=status.HTTP_404_NOT_FOUND
                 )
+            attempts = MockExamAttempt.objects.filter(
+                mock_exam_id=exam_id,
+                is_completed=True
+            )
         else:
             # Overall analysis
             attempts = MockExamAttempt.objects.filter(
@@ -178,14 +309,19 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
             is_completed=True
         ).exclude(student=user)
 
-        # Calculate comparative metrics
+        # Calculate comparative metrics; peer stats exclude the current
+        # student, so the cache entry is per student
         student_stats = self._calculate_student_stats(attempts)
-        peer_stats = self._calculate_peer_stats(peer_attempts)
+        peer_stats = cache.get_or_set(
+            f'peer_stats:{user.id}',
+            lambda: self._calculate_peer_stats(peer_attempts),
+            timeout=PEER_STATS_CACHE_TIMEOUT
+        )
 
         return Response({
             'student_performance': student_stats,
             'peer_comparison': peer_stats,
-            'percentiles': self._calculate_percentiles(student_stats, peer_stats),
+            'percentiles': self._calculate_percentiles(student_stats, peer_stats, peer_attempts),
             'improvement_potential': self._calculate_improvement_potential(student_stats, peer_stats)
         })
 
@@ -208,13 +344,22 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
         user = request.user
         target_date_str = request.query_params.get('target_date')
 
-        # Get recent performance data
-        recent_attempts = MockExamAttempt.objects.filter(
+        completed_attempts = MockExamAttempt.objects.filter(
             student=user,
             is_completed=True
-        ).order_by('-started_at')[:20]
+        ).order_by('-started_at')
+
+        # The prediction only changes when another exam is completed
+        last_attempt_id = completed_attempts.values_list('id', flat=True).first()
+        cache_key = f'score_prediction:{user.id}:{last_attempt_id}'
+        prediction_data = cache.get(cache_key)
+        if prediction_data is not None:
+            return Response(prediction_data)
 
-        if len(recent_attempts) < 3:
+        # Get recent performance data
+        recent_scores = list(completed_attempts.values_list('sat_score', flat=True)[:20])
+
+        if len(recent_scores) < 3:
             return Response({
                 'prediction': None,
                 'message': 'Insufficient data for prediction. Need at least 3 completed exams.',
@@ -222,7 +367,8 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
             })
 
         # Calculate trend and predict
-        prediction_data = self._predict_scores(recent_attempts, target_date_str)
+        prediction_data = self._predict_scores(recent_scores, target_date_str)
+        cache.set(cache_key, prediction_data, timeout=SCORE_PREDICTION_CACHE_TIMEOUT)
 
         return Response(prediction_data)
 
@@ -236,13 +382,13 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
         """Get adaptive study recommendations."""
         user = request.user
 
-        # Get performance data
-        attempts = MockExamAttempt.objects.filter(
+        # Get performance data once; every helper below works on these rows
+        attempts = list(MockExamAttempt.objects.filter(
             student=user,
             is_completed=True
-        ).order_by('-started_at')
+        ).order_by('-started_at').values('sat_score', *self.SECTION_SCORE_FIELDS))
 
-        if not attempts.exists():
+        if not attempts:
             return Response({
                 'recommendations': [],
                 'message': 'No completed exams found for recommendations.'
@@ -257,16 +403,43 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
             'study_plan': self._generate_study_plan(attempts)
         })
 
-    def _calculate_accuracy(self, attempt):
+    def _calculate_accuracy(self, total_raw_score, total_questions):
         """Calculate accuracy percentage for an attempt."""
-        if not attempt.total_raw_score or not attempt.mock_exam:
+        if not total_raw_score or total_questions == 0:
             return 0
         
-        total_questions = attempt.mock_exam.total_questions
-        if total_questions == 0:
-            return 0
-        
-        return round((attempt.total_raw_score / total_questions) * 100, 2)
+        return round((total_raw_score / total_questions) * 100, 2)
+
+    def _section_question_counts(self, exam_ids, section):
+        """Map each exam id to its number of questions in a section."""
+        return dict(
+            MockExam.objects.filter(id__in=exam_ids).annotate(
+                question_count=Count(f'{section}_questions')
+            ).values_list('id', 'question_count')
+        )
+
+    def _exam_question_totals(self, exam_types):
+        """
+        Map each exam id to its total question count.
+
+        Takes {exam_id: exam_type} and follows the same section rules as
+        MockExam.total_questions, with one query per section instead of
+        per exam.
+        """
+        totals = dict.fromkeys(exam_types, 0)
+        for section, included_types in (
+            ('math', ('FULL', 'MATH_ONLY')),
+            ('reading', ('FULL', 'READING_WRITING_ONLY')),
+            ('writing', ('FULL', 'READING_WRITING_ONLY')),
+        ):
+            exam_ids = [
+                exam_id for exam_id, exam_type in exam_types.items()
+                if exam_type in included_types
+            ]
+            if exam_ids:
+                for exam_id, count in self._section_question_counts(exam_ids, section).items():
+                    totals[exam_id] += count
+        return totals
 
     def _calculate_trend_summary(self, trend_data):
         """Calculate summary statistics from trend data."""
@@ -284,73 +457,65 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
             'total_exams': len(trend_data)
         }
 
-    def _analyze_section_performance(self, attempts, section):
-        """Analyze performance for a specific section."""
-        total_questions = 0
-        correct_answers = 0
-        
+    def _analyze_all_sections(self, attempts):
+        """
+        Analyze performance for every section in one pass over the attempts.
+
+        ``attempts`` are dict rows holding SECTION_SCORE_FIELDS; returns the
+        per-section results keyed by section name.
+        """
+        total_questions = dict.fromkeys(SECTIONS, 0)
+        correct_answers = dict.fromkeys(SECTIONS, 0)
+
+        # Count each section's questions for every exam, one query per section
+        exam_ids = {attempt['mock_exam_id'] for attempt in attempts}
+        question_counts = {
+            section: self._section_question_counts(exam_ids, section)
+            for section in SECTIONS
+        }
+
         for attempt in attempts:
-            if section == 'math':
-                total_questions += attempt.mock_exam.math_questions.count() if attempt.mock_exam else 0
-                correct_answers += attempt.math_raw_score or 0
-            elif section == 'reading':
-                total_questions += attempt.mock_exam.reading_questions.count() if attempt.mock_exam else 0
-                correct_answers += attempt.reading_raw_score or 0
-            elif section == 'writing':
-                total_questions += attempt.mock_exam.writing_questions.count() if attempt.mock_exam else 0
-                correct_answers += attempt.writing_raw_score or 0
-
-        accuracy = (correct_answers / total_questions * 100) if total_questions > 0 else 0
+            for section in SECTIONS:
+                total_questions[section] += question_counts[section].get(attempt['mock_exam_id'], 0)
+                correct_answers[section] += attempt[f'{section}_raw_score'] or 0
+
+        performance = {}
+        for section in SECTIONS:
+            total = total_questions[section]
+            accuracy = (correct_answers[section] / total * 100) if total > 0 else 0
+            performance[section] = {
+                'section': section,
+                'total_questions': total,
+                'correct_answers': correct_answers[section],
+                'accuracy': round(accuracy, 2)
+            }
 
-        return {
-            'section': section,
-            'total_questions': total_questions,
-            'correct_answers': correct_answers,
-            'accuracy': round(accuracy, 2)
-        }
+        return performance
 
     def _get_section_recommendations(self, section, performance):
         """Get recommendations for improving section performance."""
-        recommendations = []
-
         if section == 'math':
             if performance['accuracy'] < 50:
-                recommendations.extend([
-                    'Focus on fundamental algebra concepts',
-                    'Practice basic arithmetic operations',
-                    'Review geometry formulas and theorems'
-                ])
-            else:
-                recommendations.extend([
-                    'Work on advanced problem-solving strategies',
-                    'Practice time management for complex problems',
-                    'Review data analysis and statistics'
-                ])
-        elif section == 'reading':
-            recommendations.extend([
-                'Practice active reading techniques',
-                'Focus on vocabulary building',
-                'Work on passage analysis strategies'
-            ])
-        elif section == 'writing':
-            recommendations.extend([
-                'Review grammar rules and conventions',
-                'Practice essay structure and organization',
-                'Work on sentence clarity and conciseness'
-            ])
-
-        return recommendations
+                return SECTION_RECOMMENDATIONS['math_basic']
+            return SECTION_RECOMMENDATIONS['math_advanced']
+        return SECTION_RECOMMENDATIONS.get(section, ())
 
     def _get_overall_weak_areas_analysis(self, attempts):
         """Get overall weak areas analysis."""
         if not attempts:
             return {}
 
-        # Calculate overall metrics
-        avg_score = attempts.aggregate(Avg('sat_score'))['sat_score__avg'] or 0
-        avg_math = attempts.aggregate(Avg('math_scaled_score'))['math_scaled_score__avg'] or 0
-        avg_reading = attempts.aggregate(Avg('reading_scaled_score'))['reading_scaled_score__avg'] or 0
-        avg_writing = attempts.aggregate(Avg('writing_scaled_score'))['writing_scaled_score__avg'] or 0
+        # Calculate overall metrics in a single aggregate query
+        averages = attempts.aggregate(
+            Avg('sat_score'),
+            Avg('math_scaled_score'),
+            Avg('reading_scaled_score'),
+            Avg('writing_scaled_score')
+        )
+        avg_score = averages['sat_score__avg'] or 0
+        avg_math = averages['math_scaled_score__avg'] or 0
+        avg_reading = averages['reading_scaled_score__avg'] or 0
+        avg_writing = averages['writing_scaled_score__avg'] or 0
 
         # Identify weakest section
         section_scores = {
@@ -358,7 +523,7 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
             'Reading': avg_reading,
             'Writing': avg_writing
         }
-        weakest_section = min(section_scores, key=section_scores.get)
+        weakest_section, _ = min(section_scores.items(), key=lambda item: item[1])
 
         return {
             'average_score': round(avg_score, 2),
@@ -370,44 +535,56 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
 
     def _calculate_student_stats(self, attempts):
         """Calculate student performance statistics."""
-        if not attempts.exists():
+        # duration_seconds is a model property, so average the raw interval
+        stats = attempts.aggregate(
+            average_score=Avg('sat_score'),
+            highest_score=Max('sat_score'),
+            lowest_score=Min('sat_score'),
+            score_std_dev=StdDev('sat_score'),
+            total_exams=Count('id'),
+            average_duration=Avg(ExpressionWrapper(
+                F('submitted_at') - F('started_at'),
+                output_field=DurationField()
+            ))
+        )
+        if not stats['total_exams']:
             return {}
 
+        average_duration = stats.pop('average_duration')
         return {
-            'average_score': attempts.aggregate(Avg('sat_score'))['sat_score__avg'] or 0,
-            'highest_score': attempts.aggregate(Max('sat_score'))['sat_score__max'] or 0,
-            'lowest_score': attempts.aggregate(Min('sat_score'))['sat_score__min'] or 0,
-            'score_std_dev': attempts.aggregate(StdDev('sat_score'))['sat_score__stddev'] or 0,
-            'total_exams': attempts.count(),
-            'average_time': attempts.aggregate(Avg('duration_seconds'))['duration_seconds__avg'] or 0
+            **{key: value or 0 for key, value in stats.items()},
+            'average_time': average_duration.total_seconds() if average_duration else 0
         }
 
     def _calculate_peer_stats(self, attempts):
         """Calculate peer group statistics."""
-        if not attempts.exists():
+        stats = attempts.aggregate(
+            peer_average=Avg('sat_score'),
+            peer_highest=Max('sat_score'),
+            peer_lowest=Min('sat_score'),
+            peer_std_dev=StdDev('sat_score'),
+            total_peer_exams=Count('id')
+        )
+        if not stats['total_peer_exams']:
             return {}
 
-        return {
-            'peer_average': attempts.aggregate(Avg('sat_score'))['sat_score__avg'] or 0,
-            'peer_highest': attempts.aggregate(Max('sat_score'))['sat_score__max'] or 0,
-            'peer_lowest': attempts.aggregate(Min('sat_score'))['sat_score__min'] or 0,
-            'peer_std_dev': attempts.aggregate(StdDev('sat_score'))['sat_score__stddev'] or 0,
-            'total_peer_exams': attempts.count()
-        }
+        return {key: value or 0 for key, value in stats.items()}
 
-    def _calculate_percentiles(self, student_stats, peer_stats):
+    def _calculate_percentiles(self, student_stats, peer_stats, peer_attempts):
         """Calculate percentile rankings."""
         if not student_stats or not peer_stats:
             return {}
 
         student_score = student_stats.get('average_score', 0)
-        peer_avg = peer_stats.get('peer_average', 0)
-        peer_std = peer_stats.get('peer_std_dev', 1)
 
-        # Simple percentile calculation using z-score
-        if peer_std > 0:
-            z_score = (student_score - peer_avg) / peer_std
-            percentile = max(0, min(100, 50 + z_score * 20))  # Rough approximation
+        # Percent rank against peers: the share of scored peer attempts
+        # strictly below the student's average, counted in one query
+        ranking = peer_attempts.aggregate(
+            below=Count('id', filter=Q(sat_score__lt=student_score)),
+            scored=Count('sat_score')
+        )
+        if ranking['scored']:
+            percentile = ranking['below'] / ranking['scored'] * 100
         else:
             percentile = 50
 
@@ -463,9 +640,9 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
         else:
             return '6+ months'
 
-    def _predict_scores(self, attempts, target_date_str):
+    def _predict_scores(self, scores, target_date_str):
         """Predict future scores based on trends."""
-        scores = [attempt.sat_score for attempt in attempts if attempt.sat_score]
+        scores = [score for score in scores if score]
         
         if len(scores) < 3:
             return {
@@ -475,17 +652,8 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
             }
 
         # Simple linear regression for trend
-        x = list(range(len(scores)))
         n = len(scores)
-        
-        # Calculate slope (trend)
-        sum_x = sum(x)
-        sum_y = sum(scores)
-        sum_xy = sum(x[i] * scores[i] for i in range(n))
-        sum_x2 = sum(x[i] ** 2 for i in range(n))
-        
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x ** 2)
-        intercept = (sum_y - slope * sum_x) / n
+        slope, intercept = _fit_trend(scores)
 
         # Predict next score
         next_x = n
@@ -528,7 +696,7 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
         if not recent_attempts:
             return recommendations
 
-        avg_score = sum(attempt.sat_score for attempt in recent_attempts if attempt.sat_score) / len(recent_attempts)
+        avg_score = sum(attempt['sat_score'] for attempt in recent_attempts if attempt['sat_score']) / len(recent_attempts)
         
         # Score-based recommendations
         if avg_score < 1000:
@@ -569,9 +737,10 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
         focus_areas = []
         
         # Analyze section performance
+        performance_by_section = self._analyze_all_sections(attempts)
         section_performance = {}
-        for section in ['math', 'reading', 'writing']:
-            perf = self._analyze_section_performance(attempts, section)
+        for section in SECTIONS:
+            perf = performance_by_section[section]
             section_performance[section] = perf['accuracy']
             
             if perf['accuracy'] < 70:
@@ -586,11 +755,12 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
 
     def _generate_study_plan(self, attempts):
         """Generate personalized study plan."""
-        if not attempts.exists():
+        if not attempts:
             return {}
 
-        # Calculate current level
-        avg_score = attempts.aggregate(Avg('sat_score'))['sat_score__avg'] or 0
+        # Calculate current level over the scored attempts
+        scores = [attempt['sat_score'] for attempt in attempts if attempt['sat_score'] is not None]
+        avg_score = sum(scores) / len(scores) if scores else 0
         
         plan = {
             'current_level': self._get_level_description(avg_score),
@@ -627,82 +797,38 @@ class ExamAnalyticsViewSet(viewsets.ViewSet):
     def _get_weekly_goals(self, score):
         """Get weekly study goals based on score level."""
         if score < 1000:
-            return [
-                'Complete 2 practice sections',
-                'Review 50 vocabulary words',
-                'Practice 30 math problems',
-                'Read 3 passages daily'
-            ]
+            return WEEKLY_GOALS_BEGINNER
         elif score < 1200:
-            return [
-                'Complete 1 full practice test',
-                'Focus on weak areas',
-                'Practice timed sections',
-                'Review mistakes thoroughly'
-            ]
+            return WEEKLY_GOALS_INTERMEDIATE
         else:
-            return [
-                'Complete 2 full practice tests',
-                'Focus on timing strategies',
-                'Practice advanced problems',
-                'Perfect calculator usage'
-            ]
+            return WEEKLY_GOALS_ADVANCED
 
     def _get_daily_tasks(self, score):
         """Get daily study tasks based on score level."""
         if score < 1000:
-            return [
-                '30 minutes math practice',
-                '20 minutes vocabulary',
-                '15 minutes reading practice'
-            ]
+            return DAILY_TASKS_BEGINNER
         elif score < 1200:
-            return [
-                '45 minutes focused practice',
-                '15 minutes review mistakes',
-                '10 minutes vocabulary'
-            ]
+            return DAILY_TASKS_INTERMEDIATE
         else:
-            return [
-                '60 minutes advanced practice',
-                '30 minutes timed sections',
-                '15 minutes strategy review'
-            ]
+            return DAILY_TASKS_ADVANCED
 
     def _get_milestones(self, score):
         """Get study milestones based on current score."""
-        milestones = []
-        
         if score < 1000:
-            milestones.extend([
-                {'score': 1000, 'description': 'Reach Intermediate Level', 'timeline': '2-3 months'},
-                {'score': 1100, 'description': 'Build Consistency', 'timeline': '4-5 months'}
-            ])
+            return MILESTONES_BEGINNER
         elif score < 1200:
-            milestones.extend([
-                {'score': 1200, 'description': 'Reach Advanced Level', 'timeline': '2-3 months'},
-                {'score': 1300, 'description': 'Strong Performance', 'timeline': '4-6 months'}
-            ])
+            return MILESTONES_INTERMEDIATE
         elif score < 1400:
-            milestones.extend([
-                {'score': 1400, 'description': 'Expert Level', 'timeline': '3-4 months'},
-                {'score': 1500, 'description': 'Top Performer', 'timeline': '5-6 months'}
-            ])
+            return MILESTONES_ADVANCED
         else:
-            milestones.extend([
-                {'score': 1550, 'description': 'Near Perfect', 'timeline': '2-3 months'},
-                {'score': 1600, 'description': 'Perfect Score', 'timeline': '4-6 months'}
-            ])
-
-        return milestones
+            return MILESTONES_EXPERT
 
     def _get_study_focus(self, section_scores):
         """Get overall study focus based on section scores."""
-        weakest = min(section_scores, key=section_scores.get)
-        strongest = max(section_scores, key=section_scores.get)
+        weakest, weakest_score = min(section_scores.items(), key=lambda item: item[1])
         
         focus = f"Primary focus on {weakest} section"
-        if section_scores[weakest] < 600:
+        if weakest_score < 600:
             focus += " (urgent improvement needed)"
         
         return focus
@@ -714,6 +840,13 @@ class ExamPerformanceViewSet(viewsets.ViewSet):
     """
     permission_classes = [IsStudent]
 
+    # Columns read by the metrics and autosave endpoints; the exam title and
+    # type come along in the same query via select_related
+    ACTIVE_ATTEMPT_FIELDS = (
+        'id', 'answers', 'started_at', 'submitted_at',
+        'mock_exam__title', 'mock_exam__exam_type'
+    )
+
     @extend_schema(
         summary="Get real-time performance metrics",
         description="Get real-time performance metrics during an active exam session.",
@@ -722,13 +855,8 @@ class ExamPerformanceViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def real_time_metrics(self, request):
         """Get real-time performance metrics for active exam."""
-        user = request.user
-        
         # Get active attempt
-        active_attempt = MockExamAttempt.objects.filter(
-            student=user,
-            is_completed=False
-        ).first()
+        active_attempt = self._get_active_attempt(request)
 
         if not active_attempt:
             return Response({
@@ -754,14 +882,10 @@ class ExamPerformanceViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['post'])
     def save_response(self, request):
         """Save question response in real-time."""
-        user = request.user
         data = request.data
 
         # Get active attempt
-        active_attempt = MockExamAttempt.objects.filter(
-            student=user,
-            is_completed=False
-        ).first()
+        active_attempt = self._get_active_attempt(request)
 
         if not active_attempt:
             return Response(
@@ -781,6 +905,14 @@ class ExamPerformanceViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        try:
+            time_spent = int(time_spent)
+        except (TypeError, ValueError):
+            return Response(
+                {"detail": "time_spent_seconds must be a number"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         # Update answers
         if not active_attempt.answers:
             active_attempt.answers = {}
@@ -792,21 +924,29 @@ class ExamPerformanceViewSet(viewsets.ViewSet):
         
         active_attempt.answers[section][str(question_id)] = answer
 
-        # Update time spent
-        if not active_attempt.time_spent_by_section:
-            active_attempt.time_spent_by_section = {}
-        
-        if section in active_attempt.time_spent_by_section:
-            active_attempt.time_spent_by_section[section] += time_spent
-        else:
-            active_attempt.time_spent_by_section[section] = time_spent
+        # Patch only the touched keys in the stored JSON, so a concurrent
+        # save of another question is not overwritten by this copy; the
+        # section time is incremented by the database for the same reason
+        section_time = Coalesce(
+            Cast(KeyTextTransform(section, 'time_spent_by_section'), IntegerField()), 0
+        )
+        MockExamAttempt.objects.filter(pk=active_attempt.pk).update(
+            answers=JSONSet('answers', (section, question_id), answer),
+            time_spent_by_section=JSONSet(
+                'time_spent_by_section', (section,), section_time + time_spent
+            ),
+            updated_at=timezone.now()
+        )
 
-        active_attempt.save()
+        # Progress from the cached question counts instead of COUNT queries
+        section_totals = self._get_section_totals(active_attempt.mock_exam)
 
         return Response({
             'saved': True,
-            'section_progress': active_attempt.get_section_progress(section),
-            'overall_progress': active_attempt.get_overall_progress()
+            'section_progress': self._percentage(
+                len(active_attempt.answers[section]), section_totals[section]
+            ),
+            'overall_progress': self._get_overall_progress(active_attempt, section_totals)
         })
 
     @extend_schema(
@@ -819,10 +959,13 @@ class ExamPerformanceViewSet(viewsets.ViewSet):
         """Get remaining time for active exam."""
         user = request.user
         
-        # Get active attempt
+        # Get active attempt with only the columns the time limit needs
         active_attempt = MockExamAttempt.objects.filter(
             student=user,
             is_completed=False
+        ).select_related('mock_exam').only(
+            'id', 'started_at', 'mock_exam__exam_type', 'mock_exam__math_time_limit',
+            'mock_exam__reading_time_limit', 'mock_exam__writing_time_limit'
         ).first()
 
         if not active_attempt:
@@ -855,12 +998,7 @@ class ExamPerformanceViewSet(viewsets.ViewSet):
         user = request.user
         
         # Get active attempt
-        active_attempt = MockExamAttempt.objects.filter(
-            student=user,
-            is_completed=False
-        ).first()
-
-        if not active_attempt:
+        if not self._get_active_attempt_id(user):
             return Response(
                 {"detail": "No active exam session found"},
                 status=status.HTTP_400_BAD_REQUEST
@@ -884,12 +1022,7 @@ class ExamPerformanceViewSet(viewsets.ViewSet):
         user = request.user
         
         # Get active attempt
-        active_attempt = MockExamAttempt.objects.filter(
-            student=user,
-            is_completed=False
-        ).first()
-
-        if not active_attempt:
+        if not self._get_active_attempt_id(user):
             return Response(
                 {"detail": "No active exam session found"},
                 status=status.HTTP_400_BAD_REQUEST
@@ -900,43 +1033,89 @@ class ExamPerformanceViewSet(viewsets.ViewSet):
             'message': 'Exam session resumed successfully'
         })
 
+    def _get_active_attempt(self, request):
+        """Get the user's in-progress attempt with its exam, once per request."""
+        if not hasattr(request, '_active_attempt'):
+            request._active_attempt = MockExamAttempt.objects.filter(
+                student=request.user,
+                is_completed=False
+            ).select_related('mock_exam').only(*self.ACTIVE_ATTEMPT_FIELDS).first()
+        return request._active_attempt
+
+    def _get_active_attempt_id(self, user):
+        """Get the id of the user's newest in-progress attempt."""
+        return MockExamAttempt.objects.filter(
+            student=user,
+            is_completed=False
+        ).values_list('id', flat=True).first()
+
     def _calculate_real_time_metrics(self, attempt):
         """Calculate real-time performance metrics."""
-        metrics = {
-            'section_progress': {},
-            'overall_progress': attempt.get_overall_progress(),
+        # Question counts come from the cached section map, not COUNT queries
+        answers = attempt.answers or {}
+        section_totals = self._get_section_totals(attempt.mock_exam)
+        answered = {section: len(answers.get(section, {})) for section in SECTIONS}
+
+        # Accuracy would need the correct answers; only progress is tracked for now
+        return {
+            'section_progress': {
+                section: self._percentage(answered[section], section_totals[section])
+                for section in SECTIONS
+            },
+            'overall_progress': self._get_overall_progress(attempt, section_totals),
             'time_elapsed': int(attempt.duration_seconds),
-            'questions_answered': 0,
+            'questions_answered': sum(answered.values()),
             'accuracy': 0
         }
 
-        total_answered = 0
-        total_correct = 0
-
-        for section in ['math', 'reading', 'writing']:
-            progress = attempt.get_section_progress(section)
-            metrics['section_progress'][section] = progress
-            
-            # Count answered questions
-            if attempt.answers and section in attempt.answers:
-                section_answered = len(attempt.answers[section])
-                total_answered += section_answered
-
-                # Calculate accuracy (simplified - would need correct answers)
-                # For now, just track answered count
-                metrics['questions_answered'] = total_answered
-
-        return metrics
-
     def _get_question_section(self, question_id, mock_exam):
         """Determine which section a question belongs to."""
-        # Check if question is in math section
-        if mock_exam.math_questions.filter(id=question_id).exists():
-            return 'math'
-        elif mock_exam.reading_questions.filter(id=question_id).exists():
-            return 'reading'
-        elif mock_exam.writing_questions.filter(id=question_id).exists():
-            return 'writing'
-        
+        section_map = self._get_question_section_map(mock_exam)
+
         # Default fallback
-        return 'math'
+        return section_map.get(str(question_id), 'math')
+
+    def _get_section_totals(self, mock_exam):
+        """Count the exam's questions per section."""
+        section_counts = Counter(self._get_question_section_map(mock_exam).values())
+        return {section: section_counts[section] for section in SECTIONS}
+
+    def _get_overall_progress(self, attempt, section_totals):
+        """Get overall exam progress, as MockExamAttempt.get_overall_progress does."""
+        answers = attempt.answers or {}
+        answered = sum(len(answers.get(section, {})) for section in SECTIONS)
+        exam_total = sum(
+            section_totals[section]
+            for section in EXAM_TYPE_SECTIONS.get(attempt.mock_exam.exam_type, ())
+        )
+        return self._percentage(answered, exam_total)
+
+    def _percentage(self, count, total):
+        """Express count as a percentage of total, 0.0 for an empty total."""
+        if not total:
+            return 0.0
+        return (count / total) * 100
+
+    def _get_question_section_map(self, mock_exam):
+        """Get the exam's {question_id: section} map, cached per exam."""
+        return cache.get_or_set(
+            f'exam_question_sections:{mock_exam.id}',
+            lambda: self._build_question_section_map(mock_exam),
+            timeout=QUESTION_SECTION_CACHE_TIMEOUT
+        )
+
+    def _build_question_section_map(self, mock_exam):
+        """Map every question id in the exam to its section in one query."""
+        section_querysets = [
+            getattr(mock_exam, f'{section}_questions').order_by().annotate(
+                section=Value(section, output_field=CharField())
+            ).values_list('id', 'section')
+            for section in SECTIONS
+        ]
+        rows = section_querysets[0].union(*section_querysets[1:], all=True)
+
+        # A question linked to several sections keeps the first (math, reading, writing)
+        section_map = {}
+        for question_id, section in rows:
+            section_map.setdefault(str(question_id), section)
+        return section_map
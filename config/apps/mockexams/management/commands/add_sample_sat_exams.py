@@ -30,11 +30,6 @@ class Command(BaseCommand):
                 writing_time_limit=0,
                 is_active=True
             )
-            math_exam.save_base(force_insert=True)
-            
-            # Add some math questions
-            math_questions = Question.objects.filter(question_type='MATH')[:25]
-            math_exam.math_questions.add(*math_questions)
             
             # Add a Reading & Writing practice test
             rw_exam = MockExam(
@@ -46,13 +41,24 @@ class Command(BaseCommand):
                 writing_time_limit=2400,  # 40 minutes
                 is_active=True
             )
-            rw_exam.save_base(force_insert=True)
             
-            # Add reading and writing questions
-            reading_questions = Question.objects.filter(question_type='READING')[:27]
-            writing_questions = Question.objects.filter(question_type='WRITING')[:27]
-            rw_exam.reading_questions.add(*reading_questions)
-            rw_exam.writing_questions.add(*writing_questions)
+            # Insert both exams with a single INSERT; MockExam.clean() only
+            # checks questions once an exam has a pk, so nothing is skipped
+            MockExam.objects.bulk_create([math_exam, rw_exam])
+            
+            # Link questions by id, one INSERT per section relation
+            for relation, exam, question_type, limit in [
+                (MockExam.math_questions, math_exam, 'MATH', 25),
+                (MockExam.reading_questions, rw_exam, 'READING', 27),
+                (MockExam.writing_questions, rw_exam, 'WRITING', 27),
+            ]:
+                question_ids = Question.objects.filter(
+                    question_type=question_type
+                ).values_list('id', flat=True)[:limit]
+                relation.through.objects.bulk_create([
+                    relation.through(mockexam_id=exam.id, question_id=question_id)
+                    for question_id in question_ids
+                ], ignore_conflicts=True, batch_size=500)
             
             self.stdout.write(self.style.SUCCESS(
                 f'Successfully added sample exams:\n'
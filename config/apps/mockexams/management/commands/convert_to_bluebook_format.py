@@ -17,10 +17,17 @@ class Command(BaseCommand):
         try:
             # Get the existing SAT test
             existing_exam = MockExam.objects.get(title='Official SAT Practice Test')
+            
+            # Get question ids from existing exam; the module links need nothing
+            # else, and their lengths double as the section counts
+            math_question_ids = list(existing_exam.math_questions.values_list('id', flat=True))
+            reading_question_ids = list(existing_exam.reading_questions.values_list('id', flat=True))
+            writing_question_ids = list(existing_exam.writing_questions.values_list('id', flat=True))
+            
             self.stdout.write(f'Found existing exam: {existing_exam.title}')
-            self.stdout.write(f'  - Math questions: {existing_exam.math_questions.count()}')
-            self.stdout.write(f'  - Reading questions: {existing_exam.reading_questions.count()}')
-            self.stdout.write(f'  - Writing questions: {existing_exam.writing_questions.count()}')
+            self.stdout.write(f'  - Math questions: {len(math_question_ids)}')
+            self.stdout.write(f'  - Reading questions: {len(reading_question_ids)}')
+            self.stdout.write(f'  - Writing questions: {len(writing_question_ids)}')
             
             # Create Bluebook exam
             bluebook_exam = BluebookExam.objects.create(
@@ -31,52 +38,56 @@ class Command(BaseCommand):
             
             self.stdout.write(f'Created Bluebook exam: {bluebook_exam.title}')
             
-            # Create Reading & Writing section (64 minutes total)
-            rw_section = BluebookSection.objects.create(
+            # Reading & Writing section (64 minutes total)
+            rw_section = BluebookSection(
                 exam=bluebook_exam,
                 section_type='READING_WRITING',
                 section_order=1,
                 total_duration_minutes=64
             )
             
-            # Create Reading & Writing modules (32 minutes each)
-            rw_module1 = BluebookModule.objects.create(
+            # Reading & Writing modules (32 minutes each)
+            rw_module1 = BluebookModule(
                 section=rw_section,
                 module_order=1,
                 time_limit_minutes=32,
                 difficulty_level='BASELINE'
             )
             
-            rw_module2 = BluebookModule.objects.create(
+            rw_module2 = BluebookModule(
                 section=rw_section,
                 module_order=2,
                 time_limit_minutes=32,
                 difficulty_level='BASELINE'  # Will be set adaptively
             )
             
-            # Create Math section (70 minutes total)
-            math_section = BluebookSection.objects.create(
+            # Math section (70 minutes total)
+            math_section = BluebookSection(
                 exam=bluebook_exam,
                 section_type='MATH',
                 section_order=2,
                 total_duration_minutes=70
             )
             
-            # Create Math modules (35 minutes each)
-            math_module1 = BluebookModule.objects.create(
+            # Math modules (35 minutes each)
+            math_module1 = BluebookModule(
                 section=math_section,
                 module_order=1,
                 time_limit_minutes=35,
                 difficulty_level='BASELINE'
             )
             
-            math_module2 = BluebookModule.objects.create(
+            math_module2 = BluebookModule(
                 section=math_section,
                 module_order=2,
                 time_limit_minutes=35,
                 difficulty_level='BASELINE'  # Will be set adaptively
             )
             
+            # Sections first, so the modules can point at their new ids
+            BluebookSection.objects.bulk_create([rw_section, math_section])
+            BluebookModule.objects.bulk_create([rw_module1, rw_module2, math_module1, math_module2])
+            
             self.stdout.write('Created Bluebook structure:')
             self.stdout.write('  - Reading & Writing Section (64 min)')
             self.stdout.write('    - Module 1: 32 min (Baseline)')
@@ -86,7 +97,10 @@ class Command(BaseCommand):
             self.stdout.write('    - Module 2: 35 min (Adaptive)')
             
             # Distribute questions across modules
-            self._distribute_questions(existing_exam, rw_module1, rw_module2, math_module1, math_module2)
+            self._distribute_questions(
+                math_question_ids, reading_question_ids, writing_question_ids,
+                rw_module1, rw_module2, math_module1, math_module2
+            )
             
             self.stdout.write(self.style.SUCCESS(
                 f'Successfully converted to Bluebook format!\n'
@@ -106,30 +120,31 @@ class Command(BaseCommand):
             import traceback
             self.stdout.write(traceback.format_exc())
 
-    def _distribute_questions(self, existing_exam, rw_module1, rw_module2, math_module1, math_module2):
+    def _distribute_questions(self, math_question_ids, reading_question_ids, writing_question_ids,
+                              rw_module1, rw_module2, math_module1, math_module2):
         """Distribute questions across modules."""
         
-        # Get questions from existing exam
-        math_questions = list(existing_exam.math_questions.all())
-        reading_questions = list(existing_exam.reading_questions.all())
-        writing_questions = list(existing_exam.writing_questions.all())
-        
-        # Distribute reading questions (split roughly evenly)
-        reading_mid = len(reading_questions) // 2
-        rw_module1.questions.add(*reading_questions[:reading_mid])
-        rw_module2.questions.add(*reading_questions[reading_mid:])
-        
-        # Distribute writing questions (split roughly evenly)
-        writing_mid = len(writing_questions) // 2
-        rw_module1.questions.add(*writing_questions[:writing_mid])
-        rw_module2.questions.add(*writing_questions[writing_mid:])
+        # Split each section's questions roughly evenly between its modules
+        reading_mid = len(reading_question_ids) // 2
+        writing_mid = len(writing_question_ids) // 2
+        math_mid = len(math_question_ids) // 2
         
-        # Distribute math questions (split roughly evenly)
-        math_mid = len(math_questions) // 2
-        math_module1.questions.add(*math_questions[:math_mid])
-        math_module2.questions.add(*math_questions[math_mid:])
+        # Insert every module-question link in one statement
+        ModuleQuestion = BluebookModule.questions.through
+        ModuleQuestion.objects.bulk_create([
+            ModuleQuestion(bluebookmodule_id=module.id, question_id=question_id)
+            for module, question_ids in [
+                (rw_module1, reading_question_ids[:reading_mid]),
+                (rw_module2, reading_question_ids[reading_mid:]),
+                (rw_module1, writing_question_ids[:writing_mid]),
+                (rw_module2, writing_question_ids[writing_mid:]),
+                (math_module1, math_question_ids[:math_mid]),
+                (math_module2, math_question_ids[math_mid:]),
+            ]
+            for question_id in question_ids
+        ], ignore_conflicts=True, batch_size=500)
         
         self.stdout.write('Question distribution:')
-        self.stdout.write(f'  - Math: {math_mid} in Module 1, {len(math_questions) - math_mid} in Module 2')
-        self.stdout.write(f'  - Reading: {reading_mid} in Module 1, {len(reading_questions) - reading_mid} in Module 2')
-        self.stdout.write(f'  - Writing: {writing_mid} in Module 1, {len(writing_questions) - writing_mid} in Module 2')
+        self.stdout.write(f'  - Math: {math_mid} in Module 1, {len(math_question_ids) - math_mid} in Module 2')
+        self.stdout.write(f'  - Reading: {reading_mid} in Module 1, {len(reading_question_ids) - reading_mid} in Module 2')
+        self.stdout.write(f'  - Writing: {writing_mid} in Module 1, {len(writing_question_ids) - writing_mid} in Module 2')
@@ -42,74 +42,86 @@ class Command(BaseCommand):
                 
                 self.stdout.write(f'Created exam: {exam.title}')
                 
-                # Create Reading & Writing Section
-                rw_section = BluebookSection.objects.create(
+                # Reading & Writing Section
+                rw_section = BluebookSection(
                     exam=exam,
                     section_type='READING_WRITING',
                     section_order=1,
                     total_duration_minutes=64  # 32 minutes per module
                 )
                 
-                # Create Math Section
-                math_section = BluebookSection.objects.create(
+                # Math Section
+                math_section = BluebookSection(
                     exam=exam,
                     section_type='MATH',
                     section_order=2,
                     total_duration_minutes=70  # 35 minutes per module
                 )
                 
+                # Create both sections in one INSERT
+                BluebookSection.objects.bulk_create([rw_section, math_section])
+                
                 self.stdout.write(f'Created sections: {rw_section.section_type}, {math_section.section_type}')
                 
-                # Get sample questions
-                math_questions = list(Question.objects.filter(question_type='MATH')[:44])
-                reading_questions = list(Question.objects.filter(question_type='READING')[:32])
-                writing_questions = list(Question.objects.filter(question_type='WRITING')[:22])
+                # Get sample question ids
+                math_question_ids = list(Question.objects.filter(question_type='MATH').values_list('id', flat=True)[:44])
+                reading_question_ids = list(Question.objects.filter(question_type='READING').values_list('id', flat=True)[:32])
+                writing_question_ids = list(Question.objects.filter(question_type='WRITING').values_list('id', flat=True)[:22])
                 
-                # Create Reading & Writing Module 1 (Baseline)
-                rw_module1 = BluebookModule.objects.create(
+                # Reading & Writing Module 1 (Baseline)
+                rw_module1 = BluebookModule(
                     section=rw_section,
                     module_order=1,
                     time_limit_minutes=32,
                     difficulty_level='BASELINE'
                 )
                 
-                # Add 16 Reading + 11 Writing questions to Module 1
-                rw_module1_questions = reading_questions[:16] + writing_questions[:11]
-                rw_module1.questions.add(*rw_module1_questions)
+                # 16 Reading + 11 Writing questions for Module 1
+                rw_module1_question_ids = reading_question_ids[:16] + writing_question_ids[:11]
                 
-                # Create Reading & Writing Module 2 (Adaptive)
-                rw_module2 = BluebookModule.objects.create(
+                # Reading & Writing Module 2 (Adaptive)
+                rw_module2 = BluebookModule(
                     section=rw_section,
                     module_order=2,
                     time_limit_minutes=32,
                     difficulty_level='EASIER'  # Adaptive difficulty
                 )
                 
-                # Add remaining 16 Reading + 11 Writing questions to Module 2
-                rw_module2_questions = reading_questions[16:32] + writing_questions[11:22]
-                rw_module2.questions.add(*rw_module2_questions)
+                # Remaining 16 Reading + 11 Writing questions for Module 2
+                rw_module2_question_ids = reading_question_ids[16:32] + writing_question_ids[11:22]
                 
-                # Create Math Module 1 (Baseline)
-                math_module1 = BluebookModule.objects.create(
+                # Math Module 1 (Baseline)
+                math_module1 = BluebookModule(
                     section=math_section,
                     module_order=1,
                     time_limit_minutes=35,
                     difficulty_level='BASELINE'
                 )
                 
-                # Add 22 Math questions to Module 1
-                math_module1.questions.add(*math_questions[:22])
-                
-                # Create Math Module 2 (Adaptive)
-                math_module2 = BluebookModule.objects.create(
+                # Math Module 2 (Adaptive)
+                math_module2 = BluebookModule(
                     section=math_section,
                     module_order=2,
                     time_limit_minutes=35,
                     difficulty_level='EASIER'  # Adaptive difficulty
                 )
                 
-                # Add remaining 22 Math questions to Module 2
-                math_module2.questions.add(*math_questions[22:44])
+                # Create all four modules in one INSERT
+                BluebookModule.objects.bulk_create([rw_module1, rw_module2, math_module1, math_module2])
+                
+                # Link all modules to their questions in one INSERT:
+                # 22 Math questions per module
+                ModuleQuestion = BluebookModule.questions.through
+                ModuleQuestion.objects.bulk_create([
+                    ModuleQuestion(bluebookmodule_id=module.id, question_id=question_id)
+                    for module, question_ids in [
+                        (rw_module1, rw_module1_question_ids),
+                        (rw_module2, rw_module2_question_ids),
+                        (math_module1, math_question_ids[:22]),
+                        (math_module2, math_question_ids[22:44]),
+                    ]
+                    for question_id in question_ids
+                ], ignore_conflicts=True, batch_size=500)
                 
                 self.stdout.write(self.style.SUCCESS(
                     f'Successfully created Bluebook Digital SAT:\n'
@@ -3,9 +3,9 @@ Management command to create an exemplar Digital SAT with realistic questions.
 """
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.utils import timezone
 from apps.mockexams.bluebook_models import BluebookExam, BluebookSection, BluebookModule
 from apps.questionbank.models import Question
-import json
 
 
 class Command(BaseCommand):
@@ -45,12 +45,7 @@ class Command(BaseCommand):
                 self.stdout.write(f'Created sections: {rw_section.section_type}, {math_section.section_type}')
                 
                 # Create sample questions for exemplar test
-                self._create_exemplar_questions()
-                
-                # Get the exemplar questions
-                math_questions = list(Question.objects.filter(question_type='MATH', skill_tag__startswith='EXEMPLAR_')[:44])
-                reading_questions = list(Question.objects.filter(question_type='READING', skill_tag__startswith='EXEMPLAR_')[:32])
-                writing_questions = list(Question.objects.filter(question_type='WRITING', skill_tag__startswith='EXEMPLAR_')[:22])
+                math_questions, reading_questions, writing_questions = self._create_exemplar_questions()
                 
                 # Create Reading & Writing Module 1 (Baseline)
                 rw_module1 = BluebookModule.objects.create(
@@ -60,10 +55,6 @@ class Command(BaseCommand):
                     difficulty_level='BASELINE'
                 )
                 
-                # Add 16 Reading + 11 Writing questions to Module 1
-                rw_module1_questions = reading_questions[:16] + writing_questions[:11]
-                rw_module1.questions.add(*rw_module1_questions)
-                
                 # Create Reading & Writing Module 2 (Adaptive)
                 rw_module2 = BluebookModule.objects.create(
                     section=rw_section,
@@ -72,10 +63,6 @@ class Command(BaseCommand):
                     difficulty_level='EASIER'  # Adaptive difficulty
                 )
                 
-                # Add remaining 16 Reading + 11 Writing questions to Module 2
-                rw_module2_questions = reading_questions[16:32] + writing_questions[11:22]
-                rw_module2.questions.add(*rw_module2_questions)
-                
                 # Create Math Module 1 (Baseline)
                 math_module1 = BluebookModule.objects.create(
                     section=math_section,
@@ -84,9 +71,6 @@ class Command(BaseCommand):
                     difficulty_level='BASELINE'
                 )
                 
-                # Add 22 Math questions to Module 1
-                math_module1.questions.add(*math_questions[:22])
-                
                 # Create Math Module 2 (Adaptive)
                 math_module2 = BluebookModule.objects.create(
                     section=math_section,
@@ -95,20 +79,36 @@ class Command(BaseCommand):
                     difficulty_level='EASIER'  # Adaptive difficulty
                 )
                 
-                # Add remaining 22 Math questions to Module 2
-                math_module2.questions.add(*math_questions[22:44])
+                # 16 Reading + 11 Writing per R&W module, 22 Math per Math module
+                module_questions = [
+                    (rw_module1, reading_questions[:16] + writing_questions[:11]),
+                    (rw_module2, reading_questions[16:32] + writing_questions[11:22]),
+                    (math_module1, math_questions[:22]),
+                    (math_module2, math_questions[22:44]),
+                ]
+                rw_m1_n, rw_m2_n, math_m1_n, math_m2_n = (
+                    len(questions) for _, questions in module_questions
+                )
+                
+                # Link all modules to their questions in one INSERT
+                ModuleQuestion = BluebookModule.questions.through
+                ModuleQuestion.objects.bulk_create([
+                    ModuleQuestion(bluebookmodule_id=module.id, question_id=question.id)
+                    for module, questions in module_questions
+                    for question in questions
+                ], ignore_conflicts=True, batch_size=500)
                 
                 self.stdout.write(self.style.SUCCESS(
                     f'Successfully created Exemplar Digital SAT:\n'
                     f'  - Exam: {exam.title}\n'
                     f'  - Total Duration: {exam.total_duration_minutes} minutes\n'
                     f'  - Reading & Writing: {rw_section.total_duration_minutes} minutes (2 modules)\n'
-                    f'    - Module 1: {rw_module1.questions.count()} questions\n'
-                    f'    - Module 2: {rw_module2.questions.count()} questions\n'
+                    f'    - Module 1: {rw_m1_n} questions\n'
+                    f'    - Module 2: {rw_m2_n} questions\n'
                     f'  - Math: {math_section.total_duration_minutes} minutes (2 modules)\n'
-                    f'    - Module 1: {math_module1.questions.count()} questions\n'
-                    f'    - Module 2: {math_module2.questions.count()} questions\n'
-                    f'  - Total Questions: {rw_module1.questions.count() + rw_module2.questions.count() + math_module1.questions.count() + math_module2.questions.count()}\n'
+                    f'    - Module 1: {math_m1_n} questions\n'
+                    f'    - Module 2: {math_m2_n} questions\n'
+                    f'  - Total Questions: {rw_m1_n + rw_m2_n + math_m1_n + math_m2_n}\n'
                     f'  - All questions are exemplar level with realistic content'
                 ))
                 
@@ -117,16 +117,17 @@ class Command(BaseCommand):
             raise
 
     def _create_exemplar_questions(self):
-        """Create realistic exemplar questions for the Digital SAT."""
+        """
+        Create realistic exemplar questions for the Digital SAT.
         
-        # Clear existing exemplar questions (using skill_tag to identify)
-        Question.objects.filter(skill_tag__startswith='EXEMPLAR_').delete()
+        Returns the saved (math, reading, writing) question lists.
+        """
         
         # Create Math exemplar questions
         math_questions = [
             {
                 'question_text': 'If 3x + 7 = 22, what is the value of x?',
-                'options': '{"A": "5", "B": "6", "C": "7", "D": "8"}',
+                'options': {'A': '5', 'B': '6', 'C': '7', 'D': '8'},
                 'correct_answer': 'A',
                 'difficulty': 1,
                 'estimated_time_seconds': 45,
@@ -135,7 +136,7 @@ class Command(BaseCommand):
             },
             {
                 'question_text': 'What is the value of 2³ × 3²?',
-                'options': '{"A": "36", "B": "72", "C": "108", "D": "144"}',
+                'options': {'A': '36', 'B': '72', 'C': '108', 'D': '144'},
                 'correct_answer': 'B',
                 'difficulty': 1,
                 'estimated_time_seconds': 30,
@@ -144,7 +145,7 @@ class Command(BaseCommand):
             },
             {
                 'question_text': 'A circle has radius 6. What is its area?',
-                'options': '{"A": "12π", "B": "18π", "C": "36π", "D": "72π"}',
+                'options': {'A': '12π', 'B': '18π', 'C': '36π', 'D': '72π'},
                 'correct_answer': 'C',
                 'difficulty': 2,
                 'estimated_time_seconds': 60,
@@ -153,7 +154,7 @@ class Command(BaseCommand):
             },
             {
                 'question_text': 'If f(x) = 2x² - 3x + 1, what is f(3)?',
-                'options': '{"A": "10", "B": "13", "C": "16", "D": "19"}',
+                'options': {'A': '10', 'B': '13', 'C': '16', 'D': '19'},
                 'correct_answer': 'A',
                 'difficulty': 2,
                 'estimated_time_seconds': 45,
@@ -162,7 +163,7 @@ class Command(BaseCommand):
             },
             {
                 'question_text': 'What is the slope of the line passing through points (2, 3) and (5, 9)?',
-                'options': '{"A": "1", "B": "2", "C": "3", "D": "4"}',
+                'options': {'A': '1', 'B': '2', 'C': '3', 'D': '4'},
                 'correct_answer': 'B',
                 'difficulty': 2,
                 'estimated_time_seconds': 60,
@@ -175,7 +176,7 @@ class Command(BaseCommand):
         reading_questions = [
             {
                 'question_text': 'Passage: Climate change represents one of the most significant challenges facing humanity today. Scientists agree that rising global temperatures are primarily caused by human activities, particularly the burning of fossil fuels. The consequences include rising sea levels, extreme weather events, and disruptions to ecosystems worldwide.\n\nQuestion: According to the passage, what is the main argument the author makes about climate change?',
-                'options': '{"A": "Climate change is primarily caused by natural cycles", "B": "Human activities are the main cause of climate change", "C": "Climate change effects are limited to polar regions", "D": "Fossil fuels have no impact on global temperatures"}',
+                'options': {'A': 'Climate change is primarily caused by natural cycles', 'B': 'Human activities are the main cause of climate change', 'C': 'Climate change effects are limited to polar regions', 'D': 'Fossil fuels have no impact on global temperatures'},
                 'correct_answer': 'B',
                 'difficulty': 2,
                 'estimated_time_seconds': 75,
@@ -184,7 +185,7 @@ class Command(BaseCommand):
             },
             {
                 'question_text': 'Passage: Climate change represents one of the most significant challenges facing humanity today. Scientists agree that rising global temperatures are primarily caused by human activities, particularly the burning of fossil fuels. The consequences include rising sea levels, extreme weather events, and disruptions to ecosystems worldwide.\n\nQuestion: What does the author suggest is the most urgent consequence of climate change?',
-                'options': '{"A": "Economic disruption", "B": "Political instability", "C": "Multiple environmental impacts", "D": "Technological advancement"}',
+                'options': {'A': 'Economic disruption', 'B': 'Political instability', 'C': 'Multiple environmental impacts', 'D': 'Technological advancement'},
                 'correct_answer': 'C',
                 'difficulty': 2,
                 'estimated_time_seconds': 60,
@@ -197,7 +198,7 @@ class Command(BaseCommand):
         writing_questions = [
             {
                 'question_text': 'Which choice best revises the underlined portion of the sentence? "The committee, which was formed last month, _______ meeting weekly to discuss the new policy."',
-                'options': '{"A": "meets", "B": "met", "C": "will meet", "D": "has met"}',
+                'options': {'A': 'meets', 'B': 'met', 'C': 'will meet', 'D': 'has met'},
                 'correct_answer': 'A',
                 'difficulty': 1,
                 'estimated_time_seconds': 45,
@@ -206,7 +207,7 @@ class Command(BaseCommand):
             },
             {
                 'question_text': 'What change, if any, should be made to this sentence? "Each of the students were required to submit their homework on time."',
-                'options': '{"A": "Change were to was", "B": "Change their to his or her", "C": "Change students to student", "D": "No change needed"}',
+                'options': {'A': 'Change were to was', 'B': 'Change their to his or her', 'C': 'Change students to student', 'D': 'No change needed'},
                 'correct_answer': 'A',
                 'difficulty': 2,
                 'estimated_time_seconds': 60,
@@ -215,49 +216,55 @@ class Command(BaseCommand):
             }
         ]
         
-        # Create the questions in the database
-        created_count = 0
-        
-        for i, q_data in enumerate(math_questions):
-            question = Question.objects.create(
-                question_text=q_data['question_text'],
-                question_type='MATH',
-                options=q_data['options'],
-                correct_answer=q_data['correct_answer'],
-                difficulty=q_data['difficulty'],
-                estimated_time_seconds=q_data['estimated_time_seconds'],
-                explanation=q_data.get('explanation', ''),
-                skill_tag=q_data['skill_tag'],
-                is_active=True
-            )
-            created_count += 1
+        # Build the questions for every section
+        questions_by_type = {
+            question_type: [
+                Question(
+                    question_text=q_data['question_text'],
+                    question_type=question_type,
+                    options=q_data['options'],
+                    correct_answer=q_data['correct_answer'],
+                    difficulty=q_data['difficulty'],
+                    estimated_time_seconds=q_data['estimated_time_seconds'],
+                    explanation=q_data.get('explanation', ''),
+                    skill_tag=q_data['skill_tag'],
+                    is_active=True
+                )
+                for q_data in section_questions
+            ]
+            for question_type, section_questions in [
+                ('MATH', math_questions),
+                ('READING', reading_questions),
+                ('WRITING', writing_questions),
+            ]
+        }
+        questions = [question for group in questions_by_type.values() for question in group]
+        for question in questions:
+            question.clean()
         
-        for i, q_data in enumerate(reading_questions):
-            question = Question.objects.create(
-                question_text=q_data['question_text'],
-                question_type='READING',
-                options=q_data['options'],
-                correct_answer=q_data['correct_answer'],
-                difficulty=q_data['difficulty'],
-                estimated_time_seconds=q_data['estimated_time_seconds'],
-                explanation=q_data.get('explanation', ''),
-                skill_tag=q_data['skill_tag'],
-                is_active=True
-            )
-            created_count += 1
+        # Each exemplar skill_tag names exactly one question, so reruns update
+        # the existing rows in place instead of deleting them (which would
+        # cascade to earlier exams' modules and students' attempts)
+        existing_ids = dict(
+            Question.objects.filter(skill_tag__startswith='EXEMPLAR_').values_list('skill_tag', 'id')
+        )
+        to_update = []
+        to_create = []
+        now = timezone.now()
+        for question in questions:
+            question.pk = existing_ids.get(question.skill_tag)
+            if question.pk:
+                # bulk_update() skips auto_now, so stamp the rewrite ourselves
+                question.updated_at = now
+                to_update.append(question)
+            else:
+                to_create.append(question)
         
-        for i, q_data in enumerate(writing_questions):
-            question = Question.objects.create(
-                question_text=q_data['question_text'],
-                question_type='WRITING',
-                options=q_data['options'],
-                correct_answer=q_data['correct_answer'],
-                difficulty=q_data['difficulty'],
-                estimated_time_seconds=q_data['estimated_time_seconds'],
-                explanation=q_data.get('explanation', ''),
-                skill_tag=q_data['skill_tag'],
-                is_active=True
-            )
-            created_count += 1
+        Question.objects.bulk_update(to_update, [
+            'question_text', 'question_type', 'options', 'correct_answer', 'difficulty',
+            'estimated_time_seconds', 'explanation', 'is_active', 'updated_at',
+        ], batch_size=500)
+        Question.objects.bulk_create(to_create, batch_size=500)
         
-        self.stdout.write(f'Created {created_count} exemplar questions')
+        self.stdout.write(f'Created {len(to_create)} and updated {len(to_update)} exemplar questions')
+        return questions_by_type['MATH'], questions_by_type['READING'], questions_by_type['WRITING']
@@ -32,43 +32,47 @@ class Command(BaseCommand):
         self.stdout.write(f'Creating full SAT test: {title}')
         
         try:
-            # Create sample questions for each section first
-            self.stdout.write('Creating questions...')
-            math_questions = self._create_math_questions()
-            reading_questions = self._create_reading_questions()
-            writing_questions = self._create_writing_questions()
+            with transaction.atomic():
+                # Create sample questions for each section first
+                self.stdout.write('Creating questions...')
+                math_questions = self._create_math_questions()
+                reading_questions = self._create_reading_questions()
+                writing_questions = self._create_writing_questions()
             
-            self.stdout.write(f'Created {len(math_questions)} math, {len(reading_questions)} reading, {len(writing_questions)} writing questions')
+                self.stdout.write(f'Created {len(math_questions)} math, {len(reading_questions)} reading, {len(writing_questions)} writing questions')
             
-            # Now create the SAT exam (skip validation)
-            sat_exam = MockExam(
-                title=title,
-                description=description,
-                exam_type='FULL',
-                math_time_limit=2700,  # 45 minutes
-                reading_time_limit=2400,  # 40 minutes  
-                writing_time_limit=2400,  # 40 minutes
-                is_active=True
-            )
-            
-            # Save without validation
-            sat_exam.save_base(force_insert=True)
+                # Now create the SAT exam
+                sat_exam = MockExam.objects.create(
+                    title=title,
+                    description=description,
+                    exam_type='FULL',
+                    math_time_limit=2700,  # 45 minutes
+                    reading_time_limit=2400,  # 40 minutes  
+                    writing_time_limit=2400,  # 40 minutes
+                    is_active=True
+                )
             
-            self.stdout.write(f'Created SAT exam with ID: {sat_exam.id}')
+                self.stdout.write(f'Created SAT exam with ID: {sat_exam.id}')
             
-            # Add questions to the exam
-            sat_exam.math_questions.add(*math_questions)
-            sat_exam.reading_questions.add(*reading_questions)
-            sat_exam.writing_questions.add(*writing_questions)
+                # Link questions to the exam, one INSERT per section relation
+                for relation, questions in [
+                    (MockExam.math_questions, math_questions),
+                    (MockExam.reading_questions, reading_questions),
+                    (MockExam.writing_questions, writing_questions),
+                ]:
+                    relation.through.objects.bulk_create([
+                        relation.through(mockexam_id=sat_exam.id, question_id=question.id)
+                        for question in questions
+                    ], ignore_conflicts=True, batch_size=500)
             
-            self.stdout.write(self.style.SUCCESS(
-                f'Successfully created full SAT test with:\n'
-                f'- {len(math_questions)} Math questions\n'
-                f'- {len(reading_questions)} Reading questions\n'
-                f'- {len(writing_questions)} Writing questions\n'
-                f'Total: {sat_exam.total_questions} questions\n'
-                f'Total time: {sat_exam.total_time_seconds // 60} minutes'
-            ))
+                self.stdout.write(self.style.SUCCESS(
+                    f'Successfully created full SAT test with:\n'
+                    f'- {len(math_questions)} Math questions\n'
+                    f'- {len(reading_questions)} Reading questions\n'
+                    f'- {len(writing_questions)} Writing questions\n'
+                    f'Total: {len(math_questions) + len(reading_questions) + len(writing_questions)} questions\n'
+                    f'Total time: {sat_exam.total_time_seconds // 60} minutes'
+                ))
                 
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'Error creating SAT test: {str(e)}'))
@@ -86,21 +90,24 @@ class Command(BaseCommand):
                 'options': {'A': '3', 'B': '4', 'C': '5', 'D': '6'},
                 'correct_answer': 'C',
                 'difficulty': 1,
-                'explanation': 'Subtract 7 from both sides: 3x = 15, then divide by 3: x = 5'
+                'explanation': 'Subtract 7 from both sides: 3x = 15, then divide by 3: x = 5',
+                'skill_tag': 'Algebra'
             },
             {
                 'question_text': 'Which of the following is equivalent to (2x + 3)(x - 4)?',
                 'options': {'A': '2x² - 5x - 12', 'B': '2x² - 8x - 12', 'C': '2x² - 5x + 12', 'D': '2x² + 7x - 12'},
                 'correct_answer': 'A',
                 'difficulty': 3,
-                'explanation': 'FOIL method: 2x·x + 2x·(-4) + 3·x + 3·(-4) = 2x² - 8x + 3x - 12 = 2x² - 5x - 12'
+                'explanation': 'FOIL method: 2x·x + 2x·(-4) + 3·x + 3·(-4) = 2x² - 8x + 3x - 12 = 2x² - 5x - 12',
+                'skill_tag': 'Algebra'
             },
             {
                 'question_text': 'If f(x) = 2x² - 3x + 1, what is f(-2)?',
                 'options': {'A': '15', 'B': '11', 'C': '7', 'D': '3'},
                 'correct_answer': 'A',
                 'difficulty': 1,
-                'explanation': 'f(-2) = 2(-2)² - 3(-2) + 1 = 2(4) + 6 + 1 = 8 + 6 + 1 = 15'
+                'explanation': 'f(-2) = 2(-2)² - 3(-2) + 1 = 2(4) + 6 + 1 = 8 + 6 + 1 = 15',
+                'skill_tag': 'Algebra'
             }
         ]
         
@@ -111,14 +118,16 @@ class Command(BaseCommand):
                 'options': {'A': '10π', 'B': '25π', 'C': '50π', 'D': '100π'},
                 'correct_answer': 'B',
                 'difficulty': 1,
-                'explanation': 'Area = πr² = π(5)² = 25π'
+                'explanation': 'Area = πr² = π(5)² = 25π',
+                'skill_tag': 'Geometry'
             },
             {
                 'question_text': 'What is the perimeter of a rectangle with length 8 and width 6?',
                 'options': {'A': '14', 'B': '24', 'C': '28', 'D': '48'},
                 'correct_answer': 'C',
                 'difficulty': 1,
-                'explanation': 'Perimeter = 2(length + width) = 2(8 + 6) = 2(14) = 28'
+                'explanation': 'Perimeter = 2(length + width) = 2(8 + 6) = 2(14) = 28',
+                'skill_tag': 'Geometry'
             }
         ]
         
@@ -129,30 +138,30 @@ class Command(BaseCommand):
                 'options': {'A': '11', 'B': '12', 'C': '13', 'D': '14'},
                 'correct_answer': 'C',
                 'difficulty': 3,
-                'explanation': 'Sum of all numbers = 12 × 5 = 60. Fifth number = 60 - (10 + 14 + 8 + 15) = 60 - 47 = 13'
+                'explanation': 'Sum of all numbers = 12 × 5 = 60. Fifth number = 60 - (10 + 14 + 8 + 15) = 60 - 47 = 13',
+                'skill_tag': 'Data Analysis'
             }
         ]
         
         # Create all math questions
         all_math = algebra_questions + geometry_questions + data_questions
         
-        for i, q_data in enumerate(all_math):
-            question = Question.objects.create(
+        for q_data in all_math:
+            questions.append(Question(
                 question_text=q_data['question_text'],
                 question_type='MATH',
-                skill_tag='Algebra' if i < 3 else 'Geometry' if i < 5 else 'Data Analysis',
+                skill_tag=q_data['skill_tag'],
                 options=q_data['options'],
                 correct_answer=q_data['correct_answer'],
                 difficulty=q_data['difficulty'],
                 explanation=q_data.get('explanation', ''),
                 estimated_time_seconds=60,
                 is_active=True
-            )
-            questions.append(question)
+            ))
         
         # Add more questions to reach a good number for a full test
         for i in range(len(questions), 25):  # Add more to reach 25 math questions
-            question = Question.objects.create(
+            questions.append(Question(
                 question_text=f'Math Question {i+1}: Solve for x in the equation {i+2}x + {i+3} = {i+15}',
                 question_type='MATH',
                 skill_tag='Algebra',
@@ -161,10 +170,9 @@ class Command(BaseCommand):
                 difficulty=3,
                 estimated_time_seconds=60,
                 is_active=True
-            )
-            questions.append(question)
+            ))
         
-        return questions
+        return self._save_questions(questions)
 
     def _create_reading_questions(self):
         """Create sample reading questions."""
@@ -182,7 +190,8 @@ class Command(BaseCommand):
                     'Study memory recall techniques'
                 ],
                 'correct_answer': 'A',
-                'difficulty': 3
+                'difficulty': 3,
+                'skill_tag': 'Purpose'
             },
             {
                 'question_text': 'The author mentions "significant decreases" in order to...',
@@ -194,33 +203,34 @@ class Command(BaseCommand):
                     'Suggest solutions for sleep problems'
                 ],
                 'correct_answer': 'A',
-                'difficulty': 2
+                'difficulty': 2,
+                'skill_tag': 'Analysis'
             },
             {
                 'question_text': 'Which of the following best describes the tone of the passage?',
                 'passage': 'Climate change represents one of the most pressing challenges of our time. Rising global temperatures, melting ice caps, and extreme weather events demand immediate attention and coordinated action. Scientists warn that without significant reductions in greenhouse gas emissions, we may face irreversible consequences within decades.',
                 'options': ['Alarmed and urgent', 'Optimistic and hopeful', 'Neutral and objective', 'Skeptical and doubtful'],
                 'correct_answer': 'A',
-                'difficulty': 1
+                'difficulty': 1,
+                'skill_tag': 'Main Idea'
             }
         ]
         
-        for i, q_data in enumerate(reading_data):
-            question = Question.objects.create(
+        for q_data in reading_data:
+            questions.append(Question(
                 question_text=q_data['question_text'],
                 question_type='READING',
-                skill_tag='Main Idea' if i == 2 else 'Analysis' if i == 1 else 'Purpose',
+                skill_tag=q_data['skill_tag'],
                 options={'A': q_data['options'][0], 'B': q_data['options'][1], 'C': q_data['options'][2], 'D': q_data['options'][3]},
                 correct_answer=q_data['correct_answer'],
                 difficulty=q_data['difficulty'],
                 estimated_time_seconds=75,
                 is_active=True
-            )
-            questions.append(question)
+            ))
         
         # Add more reading questions
         for i in range(len(questions), 27):  # Add more to reach 27 reading questions
-            question = Question.objects.create(
+            questions.append(Question(
                 question_text=f'Reading Question {i+1}: What is the main idea of the passage about topic {i+1}?',
                 question_type='READING',
                 skill_tag='Main Idea',
@@ -229,10 +239,9 @@ class Command(BaseCommand):
                 difficulty=3,
                 estimated_time_seconds=75,
                 is_active=True
-            )
-            questions.append(question)
+            ))
         
-        return questions
+        return self._save_questions(questions)
 
     def _create_writing_questions(self):
         """Create sample writing questions."""
@@ -246,7 +255,8 @@ class Command(BaseCommand):
                 'options': ['is', 'are', 'were', 'have been'],
                 'correct_answer': 'A',
                 'difficulty': 1,
-                'explanation': 'The subject is "team" (singular), so use "is". The phrase "along with their coaches" is a parenthetical phrase that does not affect the verb.'
+                'explanation': 'The subject is "team" (singular), so use "is". The phrase "along with their coaches" is a parenthetical phrase that does not affect the verb.',
+                'skill_tag': 'Grammar'
             },
             {
                 'question_text': 'Which of the following is the best way to revise sentence 2?',
@@ -258,7 +268,8 @@ class Command(BaseCommand):
                     'The research project took months to complete; it was very interesting and we learned a lot; the results were surprising.'
                 ],
                 'correct_answer': 'A',
-                'difficulty': 3
+                'difficulty': 3,
+                'skill_tag': 'Revision'
             },
             {
                 'question_text': 'The author should replace the word "very" in sentence 3 with...',
@@ -266,27 +277,27 @@ class Command(BaseCommand):
                 'options': ['extremely', 'highly', 'remarkably', 'delete the word'],
                 'correct_answer': 'D',
                 'difficulty': 1,
-                'explanation': '"Very" is often considered weak word choice. It\'s better to delete it or use more specific descriptive language.'
+                'explanation': '"Very" is often considered weak word choice. It\'s better to delete it or use more specific descriptive language.',
+                'skill_tag': 'Word Choice'
             }
         ]
         
-        for i, q_data in enumerate(writing_data):
-            question = Question.objects.create(
+        for q_data in writing_data:
+            questions.append(Question(
                 question_text=q_data['question_text'],
                 question_type='WRITING',
-                skill_tag='Grammar' if i == 0 else 'Revision' if i == 1 else 'Word Choice',
+                skill_tag=q_data['skill_tag'],
                 options={'A': q_data['options'][0], 'B': q_data['options'][1], 'C': q_data['options'][2], 'D': q_data['options'][3]},
                 correct_answer=q_data['correct_answer'],
                 difficulty=q_data['difficulty'],
                 explanation=q_data.get('explanation', ''),
                 estimated_time_seconds=60,
                 is_active=True
-            )
-            questions.append(question)
+            ))
         
         # Add more writing questions
         for i in range(len(questions), 27):  # Add more to reach 27 writing questions
-            question = Question.objects.create(
+            questions.append(Question(
                 question_text=f'Writing Question {i+1}: Which revision would improve the clarity of this sentence?',
                 question_type='WRITING',
                 skill_tag='Revision',
@@ -295,7 +306,12 @@ class Command(BaseCommand):
                 difficulty=3,
                 estimated_time_seconds=60,
                 is_active=True
-            )
-            questions.append(question)
+            ))
         
-        return questions
+        return self._save_questions(questions)
+
+    def _save_questions(self, questions):
+        """Validate and insert a section's questions in a single query."""
+        for question in questions:
+            question.clean()
+        return Question.objects.bulk_create(questions, batch_size=500)
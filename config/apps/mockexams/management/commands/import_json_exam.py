@@ -17,9 +17,16 @@ class Command(BaseCommand):
             type=str,
             help='Path to JSON file containing exam data'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of rows per INSERT when creating questions and module links'
+        )
 
     def handle(self, *args, **options):
         json_file = options['json_file']
+        batch_size = options['batch_size']
         
         self.stdout.write(f'Importing SAT exam from: {json_file}')
         
@@ -41,45 +48,45 @@ class Command(BaseCommand):
                 
                 self.stdout.write(f'Created exam: {exam.title}')
                 
-                # Create sections based on the JSON structure
-                sections_created = []
-                for section_data in exam_info['sections']:
-                    if section_data['id'] == 'math':
-                        # Math Section
-                        section = BluebookSection.objects.create(
-                            exam=exam,
-                            section_type='MATH',
-                            section_order=2,  # Math comes second in SAT
-                            total_duration_minutes=70  # 35 minutes per module
-                        )
-                        sections_created.append(('MATH', section))
-                    elif section_data['id'] == 'english':
-                        # Reading & Writing Section
-                        section = BluebookSection.objects.create(
-                            exam=exam,
-                            section_type='READING_WRITING',
-                            section_order=1,  # Reading & Writing comes first
-                            total_duration_minutes=64  # 32 minutes per module
-                        )
-                        sections_created.append(('READING_WRITING', section))
-                
-                self.stdout.write(f'Created sections: {[s[0] for s in sections_created]}')
-                
-                # Process modules and questions
+                # Create sections as the JSON introduces them, then their
+                # modules and questions in the same pass
+                sections_by_type = {}
                 total_questions = 0
                 
                 for section_data in exam_info['sections']:
                     section_type = 'MATH' if section_data['id'] == 'math' else 'READING_WRITING'
-                    section = next(s for s in sections_created if s[0] == section_type)[1]
+                    section = sections_by_type.get(section_type)
+                    if section is None:
+                        if section_type == 'MATH':
+                            # Math Section
+                            section = BluebookSection.objects.create(
+                                exam=exam,
+                                section_type='MATH',
+                                section_order=2,  # Math comes second in SAT
+                                total_duration_minutes=70  # 35 minutes per module
+                            )
+                        else:
+                            # Reading & Writing Section
+                            section = BluebookSection.objects.create(
+                                exam=exam,
+                                section_type='READING_WRITING',
+                                section_order=1,  # Reading & Writing comes first
+                                total_duration_minutes=64  # 32 minutes per module
+                            )
+                        sections_by_type[section_type] = section
+                        self.stdout.write(f'Created section: {section_type}')
+                    
+                    question_type = 'MATH' if section_type == 'MATH' else 'READING'
+                    estimated_time_seconds = 75 if section_type == 'READING_WRITING' else 90  # More time for reading
                     
                     for module_data in section_data['modules']:
-                        module_questions = []
+                        skill_tag = f'SYNTHETIC_{section_type}_{module_data["id"].upper()}'
                         
-                        # Create questions for this module
-                        for q_data in module_data['questions']:
-                            question = Question.objects.create(
+                        # Build questions for this module
+                        module_questions = [
+                            Question(
                                 question_text=q_data['prompt'],
-                                question_type='MATH' if section_type == 'MATH' else 'READING',
+                                question_type=question_type,
                                 options={
                                     'A': q_data['choices']['A'],
                                     'B': q_data['choices']['B'], 
@@ -88,13 +95,17 @@ class Command(BaseCommand):
                                 },
                                 correct_answer=q_data['correct'],
                                 difficulty=2,  # Medium difficulty
-                                estimated_time_seconds=75 if section_type == 'READING_WRITING' else 90,  # More time for reading
+                                estimated_time_seconds=estimated_time_seconds,
                                 explanation=f'Correct answer is {q_data["correct"]}',
-                                skill_tag=f'SYNTHETIC_{section_type.upper()}_{module_data["id"].upper()}',
+                                skill_tag=skill_tag,
                                 is_active=True
                             )
-                            module_questions.append(question)
-                            total_questions += 1
+                            for q_data in module_data['questions']
+                        ]
+                        for question in module_questions:
+                            question.clean()
+                        Question.objects.bulk_create(module_questions, batch_size=batch_size)
+                        total_questions += len(module_questions)
                         
                         # Create module
                         module = BluebookModule.objects.create(
@@ -104,8 +115,12 @@ class Command(BaseCommand):
                             difficulty_level='BASELINE' if 'module_1' in module_data['id'] else 'EASIER'
                         )
                         
-                        # Add questions to module
-                        module.questions.add(*module_questions)
+                        # Link questions to module in one INSERT
+                        ModuleQuestion = BluebookModule.questions.through
+                        ModuleQuestion.objects.bulk_create([
+                            ModuleQuestion(bluebookmodule_id=module.id, question_id=question.id)
+                            for question in module_questions
+                        ], ignore_conflicts=True, batch_size=batch_size)
                         
                         self.stdout.write(f'  - {module_data["title"]}: {len(module_questions)} questions')
                 
@@ -113,7 +128,7 @@ class Command(BaseCommand):
                     f'Successfully imported Synthetic SAT exam:\n'
                     f'  - Exam: {exam.title}\n'
                     f'  - Total Duration: {exam.total_duration_minutes} minutes\n'
-                    f'  - Sections: {[s[0] for s in sections_created]}\n'
+                    f'  - Sections: {list(sections_by_type)}\n'
                     f'  - Total Questions: {total_questions}\n'
                     f'  - Questions imported from: {json_file}'
                 ))
@@ -27,8 +27,7 @@ class Command(BaseCommand):
         exam_data = data['exam']
         
         try:
-            # Removed transaction.atomic for debugging
-            # with transaction.atomic():
+            with transaction.atomic():
                 # 1. Create Traditional Mock Exam
                 mock_exam, _ = MockExam.objects.get_or_create(
                     title=exam_data['title'] + " (Review Mode)",
@@ -94,7 +93,56 @@ class Command(BaseCommand):
                     defaults={'time_limit_minutes': 35, 'difficulty_level': 'HARDER'} # Must be adaptive
                 )
 
-                # Process Questions from JSON
+                # Resolve every prompt to a question up front: existing ones in
+                # one query (newest first, as filter(...).first() picked), the
+                # rest created together
+                questions_by_prompt = {}
+                prompts = {
+                    q_data['prompt']
+                    for section in exam_data['sections']
+                    for module in section['modules']
+                    for q_data in module['questions']
+                }
+                for question in Question.objects.filter(question_text__in=prompts).only('id', 'question_text'):
+                    questions_by_prompt.setdefault(question.question_text, question)
+                
+                new_questions = []
+                for section in exam_data['sections']:
+                    # Determine Type/Subject
+                    if section['id'] == 'math':
+                        q_type = 'MATH'
+                    else:
+                        q_type = 'READING' # Default for English in Bluebook context
+                        # Note: Actual Digital SAT mixes them. For MockExam model compliance (if used), we split.
+                        # But for BluebookExam, questions are just added to the module.
+                    
+                    for module in section['modules']:
+                        for q_data in module['questions']:
+                            # Handle duplicates safely
+                            if q_data['prompt'] in questions_by_prompt:
+                                continue
+                            question = Question(
+                                question_text=q_data['prompt'],
+                                question_type=q_type,
+                                skill_tag='General',
+                                difficulty=3,
+                                options=q_data['choices'],
+                                correct_answer=q_data['correct'],
+                                explanation='Correct answer is ' + q_data['correct'],
+                                is_active=True
+                            )
+                            question.clean()
+                            questions_by_prompt[q_data['prompt']] = question
+                            new_questions.append(question)
+                Question.objects.bulk_create(new_questions, batch_size=500)
+
+                # Process Questions from JSON, collecting the links to insert
+                exam_question_ids = {
+                    MockExam.math_questions: [],
+                    MockExam.reading_questions: [],
+                    MockExam.writing_questions: [],
+                }
+                module_question_ids = []
                 for section in exam_data['sections']:
                     section_id = section['id']
                     
@@ -109,57 +157,31 @@ class Command(BaseCommand):
                             elif 'module_2' in module['id']: target_module = rw_m2
 
                         for i, q_data in enumerate(module['questions']):
-                            # Determine Type/Subject
-                            if section_id == 'math':
-                                q_type = 'MATH'
-                            else:
-                                q_type = 'READING' # Default for English in Bluebook context
-                                # Note: Actual Digital SAT mixes them. For MockExam model compliance (if used), we split.
-                                # But for BluebookExam, questions are just added to the module.
-                            
-                            
-                            
-                            # Create Question - Handle duplicates safely
-                            question = Question.objects.filter(question_text=q_data['prompt']).first()
-                            if not question:
-                                question = Question.objects.create(
-                                    question_text=q_data['prompt'],
-                                    question_type=q_type,
-                                    skill_tag='General',
-                                    difficulty=3,
-                                    options=q_data['choices'],
-                                    correct_answer=q_data['correct'],
-                                    explanation='Correct answer is ' + q_data['correct'],
-                                    is_active=True
-                                )
-                            
-                            # DEBUG: Verify IDs
-                            if not question.pk: 
-                                question.save()
-                                self.stdout.write(f"Saved Question: {question.pk}")
-                            
-                            if not mock_exam.pk: 
-                                mock_exam.save()
-                                self.stdout.write(f"Saved MockExam: {mock_exam.pk}")
-
-                            if target_module and not target_module.pk:
-                                target_module.save()
-                                self.stdout.write(f"Saved Module: {target_module.pk}")
+                            question = questions_by_prompt[q_data['prompt']]
                             
                             # Add to Traditional Mock Exam
                             if section_id == 'math':
-                                try:
-                                    mock_exam.math_questions.add(question)
-                                except Exception as e:
-                                    self.stdout.write(self.style.ERROR(f"Failed to add to MockExam: {e} MockID:{mock_exam.pk} QID:{question.pk}"))
-                                    raise e
+                                exam_question_ids[MockExam.math_questions].append(question.pk)
                             else:
-                                if i % 2 == 0: mock_exam.reading_questions.add(question)
-                                else: mock_exam.writing_questions.add(question)
+                                if i % 2 == 0: exam_question_ids[MockExam.reading_questions].append(question.pk)
+                                else: exam_question_ids[MockExam.writing_questions].append(question.pk)
                             
                             # Add to Bluebook Module
                             if target_module:
-                                target_module.questions.add(question)
+                                module_question_ids.append((target_module.pk, question.pk))
+
+                # Insert each relation's links in one statement; existing links
+                # (from an earlier import) are skipped like add() did
+                for relation, question_ids in exam_question_ids.items():
+                    relation.through.objects.bulk_create([
+                        relation.through(mockexam_id=mock_exam.pk, question_id=question_id)
+                        for question_id in dict.fromkeys(question_ids)
+                    ], ignore_conflicts=True, batch_size=500)
+                ModuleQuestion = BluebookModule.questions.through
+                ModuleQuestion.objects.bulk_create([
+                    ModuleQuestion(bluebookmodule_id=module_id, question_id=question_id)
+                    for module_id, question_id in dict.fromkeys(module_question_ids)
+                ], ignore_conflicts=True, batch_size=500)
 
                 self.stdout.write(self.style.SUCCESS(f'Successfully imported exam: {bluebook_exam.title} (Bluebook) and {mock_exam.title} (Traditional)'))
                 
@@ -7,6 +7,12 @@ from django.db import transaction
 from apps.mockexams.bluebook_models import BluebookExam, BluebookSection, BluebookModule
 from apps.questionbank.models import Question
 
+try:
+    # libyaml's C parser, when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class Command(BaseCommand):
     help = 'Import SAT exam from YAML file into Bluebook system'
@@ -17,9 +23,16 @@ class Command(BaseCommand):
             type=str,
             help='Path to YAML file containing exam data'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of rows per INSERT when creating questions and module links'
+        )
 
     def handle(self, *args, **options):
         yaml_file = options['yaml_file']
+        batch_size = options['batch_size']
         
         self.stdout.write(f'Importing SAT exam from: {yaml_file}')
         
@@ -27,7 +40,7 @@ class Command(BaseCommand):
             with transaction.atomic():
                 # Read YAML file
                 with open(yaml_file, 'r', encoding='utf-8') as f:
-                    exam_data = yaml.safe_load(f)
+                    exam_data = yaml.load(f, Loader=SafeLoader)
                 
                 exam_info = exam_data['exam']
                 
@@ -63,11 +76,9 @@ class Command(BaseCommand):
                 questions_created = 0
                 
                 for module_data in exam_info['modules']:
-                    module_questions = []
-                    
-                    # Create questions for this module
-                    for q_data in module_data['questions']:
-                        question = Question.objects.create(
+                    # Build questions for this module
+                    module_questions = [
+                        Question(
                             question_text=q_data['prompt'],
                             question_type='MATH' if 'math' in q_data['id'].lower() or 'system' in q_data['prompt'].lower() else 'READING',
                             options={
@@ -83,8 +94,12 @@ class Command(BaseCommand):
                             skill_tag=f'UZBEKISTAN_{module_data["id"].upper()}',
                             is_active=True
                         )
-                        module_questions.append(question)
-                        questions_created += 1
+                        for q_data in module_data['questions']
+                    ]
+                    for question in module_questions:
+                        question.clean()
+                    Question.objects.bulk_create(module_questions, batch_size=batch_size)
+                    questions_created += len(module_questions)
                     
                     # Determine section type based on question content
                     if any('math' in q['id'].lower() or 'system' in q['prompt'].lower() or 'rocket' in q['prompt'].lower() or 'equation' in q['prompt'].lower() for q in module_data['questions']):
@@ -104,8 +119,12 @@ class Command(BaseCommand):
                             difficulty_level='BASELINE' if module_data['id'] == 'module_1' else 'EASIER'
                         )
                     
-                    # Add questions to module
-                    module.questions.add(*module_questions)
+                    # Link questions to module in one INSERT
+                    ModuleQuestion = BluebookModule.questions.through
+                    ModuleQuestion.objects.bulk_create([
+                        ModuleQuestion(bluebookmodule_id=module.id, question_id=question.id)
+                        for question in module_questions
+                    ], ignore_conflicts=True, batch_size=batch_size)
                     
                     self.stdout.write(f'  - {module_data["title"]}: {len(module_questions)} questions')
                 
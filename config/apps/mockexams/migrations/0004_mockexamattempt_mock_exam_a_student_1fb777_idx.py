@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 06:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mockexams', '0003_alter_bluebookquestionresponse_selected_answer'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mockexamattempt',
+            index=models.Index(fields=['student', 'is_completed', '-started_at'], name='mock_exam_a_student_1fb777_idx'),
+        ),
+    ]
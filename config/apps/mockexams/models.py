@@ -251,6 +251,7 @@ class MockExamAttempt(TenantModel):
             models.Index(fields=['mock_exam', 'submitted_at']),
             models.Index(fields=['sat_score']),
             models.Index(fields=['is_completed']),
+            models.Index(fields=['student', 'is_completed', '-started_at']),
         ]
         ordering = ['-started_at']
         unique_together = ['mock_exam', 'student']
@@ -3,6 +3,7 @@ Tests for the mockexams app with Bluebook-style functionality.
 """
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
@@ -386,6 +387,9 @@ class BluebookAnalyticsTests(APITestCase):
 
     def setUp(self):
         """Set up test data."""
+        # Peer statistics are cached per student id
+        cache.clear()
+
         self.student = User.objects.create_user(
             email='student@example.com',
             password='testpass123',
@@ -394,28 +398,72 @@ class BluebookAnalyticsTests(APITestCase):
             role='STUDENT'
         )
 
-        self.mock_exam = MockExam.objects.create(
-            title='SAT Practice Test',
-            exam_type='FULL',
-            math_time_limit=2700,
-            reading_time_limit=2400,
-            writing_time_limit=2400,
-            is_active=True
+        self.peer = User.objects.create_user(
+            email='peer@example.com',
+            password='testpass123',
+            first_name='Peer',
+            last_name='User',
+            role='STUDENT'
         )
 
-        # Create completed attempts with different scores
-        for score in [1000, 1100, 1200]:
-            MockExamAttempt.objects.create(
-                mock_exam=self.mock_exam,
+        # Every exam shares the same four math questions and has no
+        # reading or writing questions
+        math_questions = [
+            Question.objects.create(
+                question_text=f'Math question {number}',
+                question_type='MATH',
+                options={'A': '1', 'B': '2', 'C': '3', 'D': '4'},
+                correct_answer='A',
+                difficulty=3,
+                is_active=True
+            )
+            for number in range(1, 5)
+        ]
+
+        # A student can attempt each exam only once, so every completed
+        # attempt gets its own exam
+        now = timezone.now()
+        self.exams = []
+        for index, score in enumerate([1000, 1100, 1200]):
+            mock_exam = MockExam.objects.create(
+                title=f'SAT Practice Test {index + 1}',
+                exam_type='FULL',
+                math_time_limit=2700,
+                reading_time_limit=2400,
+                writing_time_limit=2400,
+                is_active=True
+            )
+            mock_exam.math_questions.set(math_questions)
+            self.exams.append(mock_exam)
+
+            # Math raw scores of 1, 2 and 3 out of 4 questions
+            attempt = MockExamAttempt.objects.create(
+                mock_exam=mock_exam,
                 student=self.student,
                 is_completed=True,
                 sat_score=score,
+                math_raw_score=index + 1,
+                total_raw_score=index + 1,
                 math_scaled_score=400 + score // 3,
                 reading_scaled_score=300 + score // 3,
-                writing_scaled_score=300 + score // 3,
-                submitted_at=timezone.now() - timedelta(days=score - 999)
+                writing_scaled_score=300 + score // 3
+            )
+
+            # started_at is auto_now_add; spread the attempts over three days
+            started_at = now - timedelta(days=3 - index)
+            MockExamAttempt.objects.filter(pk=attempt.pk).update(
+                started_at=started_at,
+                submitted_at=started_at + timedelta(hours=1)
             )
 
+        MockExamAttempt.objects.create(
+            mock_exam=self.exams[0],
+            student=self.peer,
+            is_completed=True,
+            sat_score=900,
+            submitted_at=now
+        )
+
     def test_performance_trends(self):
         """Test performance trends endpoint."""
         self.client.force_authenticate(user=self.student)
@@ -425,12 +473,22 @@ class BluebookAnalyticsTests(APITestCase):
         self.assertIn('trends', response.data)
         self.assertIn('summary', response.data)
         
-        # Check trend data structure
+        # Check trend data, oldest attempt first
         trends = response.data['trends']
         self.assertEqual(len(trends), 3)  # 3 attempts
-        self.assertIn('total_score', trends[0])
+        self.assertEqual([trend['total_score'] for trend in trends], [1000, 1100, 1200])
+        self.assertEqual([trend['accuracy'] for trend in trends], [25.0, 50.0, 75.0])
+        self.assertEqual(trends[0]['time_spent'], 3600)
         self.assertIn('date', trends[0])
 
+        summary = response.data['summary']
+        self.assertEqual(summary['average_score'], 1100)
+        self.assertEqual(summary['highest_score'], 1200)
+        self.assertEqual(summary['lowest_score'], 1000)
+        self.assertEqual(summary['score_improvement'], 200)
+        self.assertEqual(summary['average_accuracy'], 50.0)
+        self.assertEqual(summary['total_exams'], 3)
+
     def test_weak_areas(self):
         """Test weak areas analysis endpoint."""
         self.client.force_authenticate(user=self.student)
@@ -440,6 +498,22 @@ class BluebookAnalyticsTests(APITestCase):
         self.assertIn('weak_areas', response.data)
         self.assertIn('overall_analysis', response.data)
 
+        # Sections without questions have 0% accuracy and come first
+        weak_areas = response.data['weak_areas']
+        self.assertEqual(
+            [(area['section'], area['priority']) for area in weak_areas],
+            [('reading', 'high'), ('writing', 'high'), ('math', 'medium')]
+        )
+        math_area = weak_areas[2]
+        self.assertEqual(math_area['total_questions'], 12)
+        self.assertEqual(math_area['correct_answers'], 6)
+        self.assertEqual(math_area['accuracy'], 50.0)
+
+        overall = response.data['overall_analysis']
+        self.assertEqual(overall['average_score'], 1100)
+        self.assertEqual(overall['weakest_section'], 'Reading')
+        self.assertEqual(overall['improvement_needed'], 100)
+
     def test_comparative_analysis(self):
         """Test comparative analysis endpoint."""
         self.client.force_authenticate(user=self.student)
@@ -450,6 +524,25 @@ class BluebookAnalyticsTests(APITestCase):
         self.assertIn('peer_comparison', response.data)
         self.assertIn('percentiles', response.data)
 
+        student_performance = response.data['student_performance']
+        self.assertEqual(student_performance['average_score'], 1100)
+        self.assertEqual(student_performance['highest_score'], 1200)
+        self.assertEqual(student_performance['lowest_score'], 1000)
+        self.assertEqual(student_performance['total_exams'], 3)
+        self.assertEqual(student_performance['average_time'], 3600)
+
+        # The only peer attempt scored 900, below the student's average
+        peer_comparison = response.data['peer_comparison']
+        self.assertEqual(peer_comparison['peer_average'], 900)
+        self.assertEqual(peer_comparison['total_peer_exams'], 1)
+        self.assertEqual(response.data['percentiles'], {
+            'overall_percentile': 100.0,
+            'performance_rating': 'Excellent'
+        })
+        self.assertEqual(
+            response.data['improvement_potential']['time_to_target'], 'Target reached'
+        )
+
     def test_score_prediction(self):
         """Test score prediction endpoint."""
         self.client.force_authenticate(user=self.student)
@@ -470,6 +563,18 @@ class BluebookAnalyticsTests(APITestCase):
         self.assertIn('focus_areas', response.data)
         self.assertIn('study_plan', response.data)
 
+        # An 1100 average is intermediate level
+        recommendations = response.data['recommendations']
+        self.assertEqual([item['type'] for item in recommendations], ['intermediate'])
+        self.assertEqual(
+            [(area['area'], area['accuracy'], area['priority'])
+             for area in response.data['focus_areas']],
+            [('Math', 50.0, 'medium'), ('Reading', 0, 'high'), ('Writing', 0, 'high')]
+        )
+        study_plan = response.data['study_plan']
+        self.assertEqual(study_plan['current_level'], 'Intermediate')
+        self.assertEqual(study_plan['target_level'], 'Advanced (1200-1400)')
+
 
 class BluebookPerformanceTests(APITestCase):
     """Test cases for Bluebook performance tracking endpoints."""
@@ -500,6 +605,9 @@ class BluebookPerformanceTests(APITestCase):
             is_completed=False
         )
 
+        # Question-to-section maps are cached per exam id
+        cache.clear()
+
     def test_real_time_metrics(self):
         """Test real-time metrics endpoint."""
         self.client.force_authenticate(user=self.student)
@@ -510,6 +618,31 @@ class BluebookPerformanceTests(APITestCase):
         self.assertEqual(response.data['attempt_id'], self.active_attempt.id)
         self.assertIn('metrics', response.data)
 
+    def test_real_time_metrics_progress(self):
+        """Test that real-time metrics report progress against the exam's questions."""
+        questions = [
+            Question.objects.create(
+                question_text=f'Question {number}',
+                question_type='MATH',
+                options={'A': '1', 'B': '2', 'C': '3', 'D': '4'},
+                correct_answer='A',
+                difficulty=3,
+                is_active=True
+            )
+            for number in range(4)
+        ]
+        self.mock_exam.math_questions.add(*questions)
+        self.active_attempt.answers = {'math': {str(questions[0].id): 'A'}}
+        self.active_attempt.save()
+
+        self.client.force_authenticate(user=self.student)
+        response = self.client.get('/api/exam-performance/real_time_metrics/')
+
+        metrics = response.data['metrics']
+        self.assertEqual(metrics['section_progress'], {'math': 25.0, 'reading': 0.0, 'writing': 0.0})
+        self.assertEqual(metrics['overall_progress'], 25.0)
+        self.assertEqual(metrics['questions_answered'], 1)
+
     def test_save_response(self):
         """Test saving question response."""
         self.client.force_authenticate(user=self.student)
@@ -524,6 +657,54 @@ class BluebookPerformanceTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(response.data['saved'])
 
+    def test_save_response_keeps_other_answers(self):
+        """Test that saving a response patches only its own answer key."""
+        self.client.force_authenticate(user=self.student)
+        for question_id, answer in [(1, 'B'), (2, 'C'), (1, 'D')]:
+            self.client.post('/api/exam-performance/save_response/', {
+                'question_id': question_id,
+                'answer': answer,
+                'time_spent_seconds': 30
+            }, format='json')
+
+        self.active_attempt.refresh_from_db()
+        self.assertEqual(self.active_attempt.answers, {'math': {'1': 'D', '2': 'C'}})
+        self.assertEqual(self.active_attempt.time_spent_by_section, {'math': 90})
+
+    def test_save_response_invalid_time_spent(self):
+        """Test that a non-numeric time_spent_seconds is rejected."""
+        self.client.force_authenticate(user=self.student)
+        response = self.client.post('/api/exam-performance/save_response/', {
+            'question_id': 1,
+            'answer': 'B',
+            'time_spent_seconds': 'soon'
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_save_response_uses_question_section(self):
+        """Test that a response is stored under the section holding the question."""
+        reading_question = Question.objects.create(
+            question_text='What is the main idea?',
+            question_type='READING',
+            options={'A': 'First', 'B': 'Second', 'C': 'Third', 'D': 'Fourth'},
+            correct_answer='A',
+            difficulty=3,
+            is_active=True
+        )
+        self.mock_exam.reading_questions.add(reading_question)
+
+        self.client.force_authenticate(user=self.student)
+        response = self.client.post('/api/exam-performance/save_response/', {
+            'question_id': reading_question.id,
+            'answer': 'A',
+            'time_spent_seconds': 30
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.active_attempt.refresh_from_db()
+        self.assertEqual(self.active_attempt.answers, {'reading': {str(reading_question.id): 'A'}})
+
     def test_remaining_time(self):
         """Test remaining time endpoint."""
         self.client.force_authenticate(user=self.student)
@@ -534,6 +715,90 @@ class BluebookPerformanceTests(APITestCase):
         self.assertIn('remaining_time_seconds', response.data)
         self.assertIn('elapsed_time_seconds', response.data)
 
+    def test_remaining_time_query_count(self):
+        """Test that a remaining time poll reads the attempt and exam in one query."""
+        self.client.force_authenticate(user=self.student)
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/exam-performance/remaining_time/')
+        self.assertEqual(response.data['total_time_seconds'], 2700 + 2400 + 2400)
+
+    def test_remaining_time_uses_newest_attempt(self):
+        """Test that the newest in-progress attempt is the active one."""
+        self.client.force_authenticate(user=self.student)
+        self.client.get('/api/exam-performance/remaining_time/')
+
+        # The first attempt is still open
+        new_exam = MockExam.objects.create(
+            title='SAT Practice Test 2',
+            exam_type='MATH_ONLY',
+            math_time_limit=2700,
+            reading_time_limit=2400,
+            writing_time_limit=2400,
+            is_active=True
+        )
+        MockExamAttempt.objects.create(mock_exam=new_exam, student=self.student)
+        response = self.client.get('/api/exam-performance/remaining_time/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_time_seconds'], 2700)
+
+    def test_save_response_after_new_attempt(self):
+        """Test that answers reach a new attempt once the previous one is finished."""
+        question = Question.objects.create(
+            question_text='What is 2 + 2?',
+            question_type='MATH',
+            options={'A': '3', 'B': '4', 'C': '5', 'D': '6'},
+            correct_answer='B',
+            difficulty=1,
+            explanation='2 + 2 = 4',
+            skill_tag='Arithmetic'
+        )
+        new_exam = MockExam.objects.create(
+            title='SAT Practice Test 2',
+            exam_type='MATH_ONLY',
+            math_time_limit=2700,
+            reading_time_limit=2400,
+            writing_time_limit=2400,
+            is_active=True
+        )
+        new_exam.math_questions.add(question)
+        MockExamAttempt.objects.filter(pk=self.active_attempt.pk).update(is_completed=True)
+        new_attempt = MockExamAttempt.objects.create(mock_exam=new_exam, student=self.student)
+
+        self.client.force_authenticate(user=self.student)
+        response = self.client.post('/api/exam-performance/save_response/', {
+            'question_id': question.id,
+            'answer': 'B',
+            'time_spent_seconds': 30
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        new_attempt.refresh_from_db()
+        self.assertEqual(new_attempt.answers, {'math': {str(question.id): 'B'}})
+
+    def test_pause_session_after_completion(self):
+        """Test that a completed attempt is no longer treated as active."""
+        self.client.force_authenticate(user=self.student)
+        self.client.post('/api/exam-performance/pause_session/')
+
+        self.active_attempt.is_completed = True
+        self.active_attempt.submitted_at = timezone.now()
+        self.active_attempt.save()
+
+        response = self.client.post('/api/exam-performance/pause_session/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_remaining_time_after_completion(self):
+        """Test that a completed attempt no longer reports remaining time."""
+        self.client.force_authenticate(user=self.student)
+        self.client.get('/api/exam-performance/remaining_time/')
+
+        self.active_attempt.is_completed = True
+        self.active_attempt.submitted_at = timezone.now()
+        self.active_attempt.save()
+
+        response = self.client.get('/api/exam-performance/remaining_time/')
+        self.assertFalse(response.data['active_session'])
+
     def test_pause_session(self):
         """Test pausing exam session."""
         self.client.force_authenticate(user=self.student)